@@ -0,0 +1,4 @@
+# chess/ai/__init__.py
+#
+# Search and evaluation. Everything here works on a headless Board and uses
+# make_move / unmake_move rather than copying positions.
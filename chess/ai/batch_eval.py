@@ -0,0 +1,200 @@
+# chess/ai/batch_eval.py
+"""
+Vectorized evaluation of many positions at once (offline analysis).
+
+Positions come in as stacked piece planes, an array of shape (N, 12, 64):
+one 0/1 plane per (color, piece) in PLANE_ORDER, indexed by square
+(row * 8 + col, a8 first). Every term of evaluation.evaluate_breakdown
+(material, tapered piece-square tables, pawn structure, passed pawns, pawn
+shield and mobility) is computed with whole-array NumPy operations, and the
+results match the scalar evaluator exactly.
+
+    planes = boards_to_planes(boards)
+    result = evaluate_batch(planes)
+    result['value']                          # (N,) int64
+    result['evaluation_breakdown']['mobility']
+
+Needs NumPy (the engine itself doesn't).
+"""
+
+import numpy as np
+
+from ..constant import WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, PIECE_TYPES
+from ..psqt import MATERIAL_SCORES, MG_TABLES, EG_TABLES, PHASE_WEIGHTS, MAX_PHASE
+from .. import bitboard_batch as bbb
+from ..bitboard_batch import PLANE_ORDER, PLANE_INDEX
+from .pawns import DOUBLED_PENALTY, ISOLATED_PENALTY, SHIELD_BONUS, PASSED_MG, PASSED_EG
+from .evaluation import MOBILITY_WEIGHTS
+
+# Positions per matrix product in the linear terms (bounds the float32 copy)
+CHUNK_SIZE = 4096
+
+# Linear terms as one (768, 4) matrix: middlegame PST, endgame PST, material,
+# phase. Every entry and sum is a small integer, exact in float32.
+_LINEAR = np.zeros((len(PLANE_ORDER) * 64, 4), dtype=np.float32)
+for _plane, (_color, _name) in enumerate(PLANE_ORDER):
+    _rows = slice(_plane * 64, (_plane + 1) * 64)
+    _LINEAR[_rows, 0] = MG_TABLES[_color][_name]
+    _LINEAR[_rows, 1] = EG_TABLES[_color][_name]
+    _LINEAR[_rows, 2] = MATERIAL_SCORES[_color][_name]
+    _LINEAR[_rows, 3] = PHASE_WEIGHTS[_name]
+
+
+def board_to_planes(board):
+    """(12, 64) uint8 planes for one Board."""
+    planes = np.zeros((len(PLANE_ORDER), 64), dtype=np.uint8)
+    for plane, (color, name) in enumerate(PLANE_ORDER):
+        bb = board.bitboards[color][name]
+        while bb:
+            low = bb & -bb
+            planes[plane, low.bit_length() - 1] = 1
+            bb ^= low
+    return planes
+
+
+def boards_to_planes(boards):
+    """(N, 12, 64) uint8 planes for a sequence of Boards."""
+    if not boards:
+        return np.zeros((0, len(PLANE_ORDER), 64), dtype=np.uint8)
+    return np.stack([board_to_planes(board) for board in boards])
+
+
+def _tapered(mg, eg, phase):
+    # Same integer formula as psqt.tapered; NumPy's // floors like Python's
+    return (mg * phase + eg * (MAX_PHASE - phase)) // MAX_PHASE
+
+
+def _linear_terms(planes):
+    """(mg, eg, material, phase) arrays via chunked matrix products."""
+    flat = planes.reshape(len(planes), -1)
+    out = np.empty((len(planes), 4), dtype=np.int64)
+    for start in range(0, len(planes), CHUNK_SIZE):
+        block = flat[start:start + CHUNK_SIZE].astype(np.float32)
+        out[start:start + CHUNK_SIZE] = np.rint(block @ _LINEAR)
+    return out.T
+
+
+def _pawn_penalty(pawns):
+    """Doubled + isolated pawn penalty for one side's pawn bitboards."""
+    files = np.stack([bbb.popcount(pawns & mask) for mask in bbb.FILE_MASKS], axis=1)  # (N, 8)
+    doubled = np.maximum(files - 1, 0).sum(axis=1) * DOUBLED_PENALTY
+    padded = np.pad(files, ((0, 0), (1, 1)))
+    neighbours = padded[:, :-2] + padded[:, 2:]
+    isolated = (files * (neighbours == 0)).sum(axis=1) * ISOLATED_PENALTY
+    return doubled + isolated
+
+
+def _passed_scores(pawns, enemy_pawns, color):
+    """Passed-pawn (mg, eg) bonus for one side (unsigned)."""
+    spread = enemy_pawns | bbb.shift_east(enemy_pawns) | bbb.shift_west(enemy_pawns)
+    if color == WHITE:
+        # An enemy pawn on the same or a neighbouring file blocks every square behind it
+        blocked = bbb.fill_south(bbb.shift_south(spread))
+    else:
+        blocked = bbb.fill_north(bbb.shift_north(spread))
+    passed = pawns & ~blocked
+    mg = np.zeros(len(pawns), dtype=np.int64)
+    eg = np.zeros(len(pawns), dtype=np.int64)
+    for row, mask in enumerate(bbb.ROW_MASKS):
+        rank = 7 - row if color == WHITE else row
+        if PASSED_MG[rank] or PASSED_EG[rank]:
+            count = bbb.popcount(passed & mask)
+            mg += PASSED_MG[rank] * count
+            eg += PASSED_EG[rank] * count
+    return mg, eg
+
+
+def _shield_count(king, pawns, color):
+    """Own pawns on the two ranks in front of a king still on its first two ranks."""
+    if color == WHITE:
+        king = king & (bbb.ROW_MASKS[6] | bbb.ROW_MASKS[7])
+        spread = king | bbb.shift_east(king) | bbb.shift_west(king)
+        shield = bbb.shift_north(spread) | bbb.shift_north(bbb.shift_north(spread))
+    else:
+        king = king & (bbb.ROW_MASKS[0] | bbb.ROW_MASKS[1])
+        spread = king | bbb.shift_east(king) | bbb.shift_west(king)
+        shield = bbb.shift_south(spread) | bbb.shift_south(bbb.shift_south(spread))
+    return bbb.popcount(shield & pawns)
+
+
+def _mobility(bitboards):
+    """Mobility proxy white minus black, from (N, 12) uint64 bitboards."""
+    occupancy = {color: np.bitwise_or.reduce(bitboards[:, [PLANE_INDEX[(color, name)] for name in PIECE_TYPES]],
+                                             axis=1)
+                 for color in (WHITE, BLACK)}
+    occupied = occupancy[WHITE] | occupancy[BLACK]
+    score = np.zeros(len(bitboards), dtype=np.int64)
+    for color, sign in ((WHITE, 1), (BLACK, -1)):
+        targets = ~occupancy[color]
+        knights = bitboards[:, PLANE_INDEX[(color, KNIGHT)]]
+        bishops = bitboards[:, PLANE_INDEX[(color, BISHOP)]]
+        rooks = bitboards[:, PLANE_INDEX[(color, ROOK)]]
+        queens = bitboards[:, PLANE_INDEX[(color, QUEEN)]]
+        total = (MOBILITY_WEIGHTS[KNIGHT] * bbb.popcount(bbb.knight_attacks(knights) & targets) +
+                 MOBILITY_WEIGHTS[BISHOP] * bbb.popcount(bbb.bishop_attacks(bishops, occupied) & targets) +
+                 MOBILITY_WEIGHTS[ROOK] * bbb.popcount(bbb.rook_attacks(rooks, occupied) & targets) +
+                 MOBILITY_WEIGHTS[QUEEN] * bbb.popcount((bbb.rook_attacks(queens, occupied) |
+                                                         bbb.bishop_attacks(queens, occupied)) & targets))
+        score += sign * total
+    return score
+
+
+def evaluate_batch(planes):
+    """
+    Evaluate N positions given as (N, 12, 64) planes.
+
+    Returns:
+        Dict shaped like evaluation.evaluate_breakdown, with (N,) int64
+        arrays in place of ints: value, raw_material, positional_score,
+        phase and evaluation_breakdown {category: array}
+    """
+    planes = np.asarray(planes)
+    if planes.ndim != 3 or planes.shape[1:] != (len(PLANE_ORDER), 64):
+        raise ValueError(f"expected planes of shape (N, 12, 64), got {planes.shape}")
+
+    mg, eg, raw_material, phase = _linear_terms(planes)
+    phase = np.minimum(phase, MAX_PHASE)
+    piece_squares = _tapered(mg, eg, phase)
+
+    bitboards = bbb.from_planes(planes)                   # (N, 12) uint64
+    pawns = {color: bitboards[:, PLANE_INDEX[(color, PAWN)]] for color in (WHITE, BLACK)}
+    kings = {color: bitboards[:, PLANE_INDEX[(color, KING)]] for color in (WHITE, BLACK)}
+    structure = _pawn_penalty(pawns[BLACK]) - _pawn_penalty(pawns[WHITE])
+
+    white_mg, white_eg = _passed_scores(pawns[WHITE], pawns[BLACK], WHITE)
+    black_mg, black_eg = _passed_scores(pawns[BLACK], pawns[WHITE], BLACK)
+    passed_pawns = _tapered(white_mg - black_mg, white_eg - black_eg, phase)
+    shield = SHIELD_BONUS * (_shield_count(kings[WHITE], pawns[WHITE], WHITE) -
+                             _shield_count(kings[BLACK], pawns[BLACK], BLACK))
+    pawn_shield = shield * phase // MAX_PHASE
+
+    mobility = _mobility(bitboards)
+
+    positional_score = piece_squares + structure + passed_pawns + pawn_shield + mobility
+    return {
+        'value': raw_material + positional_score,
+        'raw_material': raw_material,
+        'positional_score': positional_score,
+        'evaluation_breakdown': {
+            'material': raw_material,
+            'piece_squares': piece_squares,
+            'pawn_structure': structure,
+            'passed_pawns': passed_pawns,
+            'pawn_shield': pawn_shield,
+            'mobility': mobility,
+        },
+        'phase': phase,
+    }
+
+
+def split_breakdowns(result):
+    """Turn an evaluate_batch result into one evaluate_breakdown-style dict (of ints) per position."""
+    breakdown = result['evaluation_breakdown']
+    for i in range(len(result['value'])):
+        yield {
+            'value': int(result['value'][i]),
+            'raw_material': int(result['raw_material'][i]),
+            'positional_score': int(result['positional_score'][i]),
+            'evaluation_breakdown': {category: int(scores[i]) for category, scores in breakdown.items()},
+            'phase': int(result['phase'][i]),
+        }
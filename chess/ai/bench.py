@@ -0,0 +1,178 @@
+# chess/ai/bench.py
+"""
+Fixed-depth search benchmark.
+
+Searches a small suite of positions at a fixed depth with each pruning
+feature switched on and off and reports nodes and time, so the effect of a
+search change can be measured rather than guessed:
+
+    python -m chess.ai.bench --depth 4
+
+With --workers it instead measures Lazy SMP scaling (nodes per second and
+time to reach the depth) for each number of processes:
+
+    python -m chess.ai.bench --depth 5 --workers 1 2 4 8
+    python -m chess.ai.bench --depth 5 --workers 1 2 4 8 --parallel root
+"""
+
+import argparse
+import time
+
+from ..board import Board
+from .search import SearchEngine
+from .transposition import TranspositionTable
+from .smp import LazySMPEngine
+from .parallel import RootParallelEngine
+
+# Positions reached from the standard setup (Board._setup_pieces) by these
+# move sequences.
+BENCH_POSITIONS = {
+    'start': [],
+    'open game': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'g8f6', 'd2d3', 'f8c5'],
+    'queens gambit': ['d2d4', 'd7d5', 'c2c4', 'e7e6', 'b1c3', 'g8f6', 'c1g5', 'f8e7'],
+    'sicilian': ['e2e4', 'c7c5', 'g1f3', 'd7d6', 'd2d4', 'c5d4', 'f3d4', 'g8f6', 'b1c3', 'a7a6'],
+    'tactics': ['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1c4', 'f8c5', 'b2b4', 'c5b4', 'c2c3', 'b4a5',
+                'd2d4', 'e5d4', 'e1g1'],
+    'endgame-ish': ['e2e4', 'd7d5', 'e4d5', 'd8d5', 'b1c3', 'd5a5', 'd2d4', 'c7c6', 'g1f3', 'c8f5',
+                    'f1c4', 'e7e6', 'c1d2', 'a5c7', 'd1e2', 'f8d6', 'c3e4', 'f5e4', 'e2e4', 'g8f6',
+                    'e4e2', 'e8g8', 'e1g1', 'b8d7'],
+}
+
+# (label, SearchEngine keyword arguments)
+CONFIGURATIONS = [
+    ('plain', {'null_move': False, 'late_move_reductions': False, 'pvs': False, 'aspiration': False}),
+    ('null move', {'null_move': True, 'late_move_reductions': False, 'pvs': False, 'aspiration': False}),
+    ('lmr', {'null_move': False, 'late_move_reductions': True, 'pvs': False, 'aspiration': False}),
+    ('null move + lmr', {'null_move': True, 'late_move_reductions': True, 'pvs': False, 'aspiration': False}),
+    ('pvs + aspiration', {'null_move': False, 'late_move_reductions': False, 'pvs': True, 'aspiration': True}),
+    ('all', {'null_move': True, 'late_move_reductions': True, 'pvs': True, 'aspiration': True}),
+]
+
+
+def bench_board(moves):
+    """A fresh Board with the given UCI moves played."""
+    board = Board()
+    for text in moves:
+        board.make_move(board.parse_uci(text))
+    return board
+
+
+def run_bench(depth=4, positions=None, configurations=None, tt_size_mb=16):
+    """
+    Search every position with every configuration.
+
+    Each search gets a fresh transposition table so runs don't help each other.
+
+    Returns:
+        List of dicts: config, position, nodes, seconds, move, score
+    """
+    positions = positions or BENCH_POSITIONS
+    configurations = configurations or CONFIGURATIONS
+    rows = []
+    for label, options in configurations:
+        for name, moves in positions.items():
+            board = bench_board(moves)
+            engine = SearchEngine(TranspositionTable(tt_size_mb), **options)
+            start = time.perf_counter()
+            result = engine.search(board, depth=depth)
+            rows.append({
+                'config': label,
+                'position': name,
+                'nodes': result.nodes,
+                'seconds': time.perf_counter() - start,
+                'move': result.best_move.uci() if result.best_move else None,
+                'score': result.score,
+            })
+    return rows
+
+
+def print_report(rows):
+    print(f"{'config':<20}{'position':<16}{'nodes':>10}{'time':>9}  {'move':<6}{'score':>7}")
+    totals = {}
+    for row in rows:
+        print(f"{row['config']:<20}{row['position']:<16}{row['nodes']:>10}{row['seconds']:>8.2f}s  "
+              f"{row['move'] or '-':<6}{row['score']:>7}")
+        nodes, seconds = totals.get(row['config'], (0, 0.0))
+        totals[row['config']] = (nodes + row['nodes'], seconds + row['seconds'])
+
+    print()
+    baseline_nodes = next(iter(totals.values()))[0]
+    for label, (nodes, seconds) in totals.items():
+        print(f"{label:<20}total {nodes:>10} nodes {seconds:>8.2f}s  "
+              f"({nodes / baseline_nodes:.0%} of {next(iter(totals))})")
+
+
+def run_smp_bench(depth=5, worker_counts=(1, 2, 4), positions=None, tt_size_mb=16, parallel='smp'):
+    """
+    Search every position at `depth` with each number of parallel workers
+    (1 = the plain single-process engine), each count with fresh tables.
+    `parallel` picks Lazy SMP ('smp') or the root-split pool ('root').
+
+    Returns:
+        List of dicts: workers, position, nodes, seconds, nps
+    """
+    positions = positions or BENCH_POSITIONS
+    rows = []
+    for workers in worker_counts:
+        if workers > 1 and parallel == 'root':
+            engine = RootParallelEngine(workers, tt_size_mb)
+        elif workers > 1:
+            engine = LazySMPEngine(workers, tt_size_mb)
+        else:
+            engine = SearchEngine(TranspositionTable(tt_size_mb))
+        try:
+            for name, moves in positions.items():
+                engine.clear()
+                board = bench_board(moves)
+                start = time.perf_counter()
+                result = engine.search(board, depth=depth)
+                seconds = time.perf_counter() - start
+                rows.append({
+                    'workers': workers,
+                    'position': name,
+                    'nodes': result.nodes,
+                    'seconds': seconds,
+                    'nps': result.nodes / seconds if seconds > 0 else 0.0,
+                })
+        finally:
+            if workers > 1:
+                engine.close()
+    return rows
+
+
+def print_smp_report(rows):
+    print(f"{'workers':<9}{'position':<16}{'nodes':>10}{'time':>9}{'nps':>10}")
+    totals = {}
+    for row in rows:
+        print(f"{row['workers']:<9}{row['position']:<16}{row['nodes']:>10}{row['seconds']:>8.2f}s"
+              f"{row['nps']:>10.0f}")
+        nodes, seconds = totals.get(row['workers'], (0, 0.0))
+        totals[row['workers']] = (nodes + row['nodes'], seconds + row['seconds'])
+
+    print()
+    base_nodes, base_seconds = next(iter(totals.values()))
+    base_nps = base_nodes / base_seconds
+    for workers, (nodes, seconds) in totals.items():
+        nps = nodes / seconds
+        print(f"{workers:<3} workers: {nps:>8.0f} nps ({nps / base_nps:.2f}x)  "
+              f"time to depth {seconds:>7.2f}s ({base_seconds / seconds:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fixed-depth search benchmark")
+    parser.add_argument('--depth', type=int, default=4, help="search depth (default 4)")
+    parser.add_argument('--tt-mb', type=int, default=16, help="transposition table size per search")
+    parser.add_argument('--workers', type=int, nargs='+', metavar='N',
+                        help="measure parallel scaling for these process counts instead")
+    parser.add_argument('--parallel', choices=('smp', 'root'), default='smp',
+                        help="parallel mode for --workers (default smp)")
+    args = parser.parse_args(argv)
+    if args.workers:
+        print_smp_report(run_smp_bench(args.depth, args.workers, tt_size_mb=args.tt_mb,
+                                       parallel=args.parallel))
+    else:
+        print_report(run_bench(args.depth, tt_size_mb=args.tt_mb))
+
+
+if __name__ == '__main__':
+    main()
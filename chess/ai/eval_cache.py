@@ -0,0 +1,64 @@
+# chess/ai/eval_cache.py
+"""
+Evaluation cache keyed by Board.zobrist_key.
+
+Quiescence and leaf nodes evaluate the same positions over and over, even
+with a transposition table. This cache stores each static evaluation in a
+direct-mapped array('Q'), so a hit skips the evaluation entirely.
+
+One 64-bit word per entry: the key's upper 44 bits (20-63) over a 20-bit
+biased score. The slot index already fixes key bits 0 to log2(slots) - 1,
+so a hit verifies 44 + log2(slots) bits: 63 at the default 4 MB (2**19
+slots, bit 19 unchecked), one fewer each time the table is halved.
+Evaluation scores must fit in +/- 2**19 centipawns.
+"""
+
+from array import array
+
+from .transposition import CacheStats, power_of_two_slots
+
+SCORE_BITS = 20
+SCORE_MASK = (1 << SCORE_BITS) - 1
+SCORE_OFFSET = 1 << (SCORE_BITS - 1)
+KEY_MASK = ((1 << 64) - 1) ^ SCORE_MASK
+ENTRY_BYTES = 8
+
+
+class EvalCache(CacheStats):
+    """
+    Args:
+        size_mb: Memory budget in megabytes
+    """
+
+    def __init__(self, size_mb=4):
+        self.size_mb = size_mb
+        self.slot_count = power_of_two_slots(size_mb, ENTRY_BYTES)
+        self.mask = self.slot_count - 1
+        self.entries = array('Q', bytes(self.slot_count * ENTRY_BYTES))
+        self._reset_counters()
+
+    def probe(self, key):
+        """Return the cached score for this key, or None."""
+        entry = self.entries[key & self.mask]
+        if entry and not (entry ^ key) & KEY_MASK:
+            self.hits += 1
+            return (entry & SCORE_MASK) - SCORE_OFFSET
+        self.misses += 1
+        return None
+
+    def store(self, key, score):
+        self.stores += 1
+        self.entries[key & self.mask] = (key & KEY_MASK) | (score + SCORE_OFFSET)
+
+    def evaluate(self, board, evaluate):
+        """evaluate(board), through the cache."""
+        key = board.zobrist_key
+        score = self.probe(key)
+        if score is None:
+            score = evaluate(board)
+            self.store(key, score)
+        return score
+
+    def clear(self):
+        self.entries = array('Q', bytes(self.slot_count * ENTRY_BYTES))
+        self._reset_counters()
@@ -0,0 +1,144 @@
+# chess/ai/evaluation.py
+"""
+Static evaluation.
+
+Scores are in centipawns from white's point of view (positive = good for
+white), matching the sign convention of Piece.value.
+
+Material and tapered piece-square terms are read from the running totals
+Board keeps in make/unmake (see chess/psqt.py), so evaluating a leaf costs
+a few integer operations, not a scan of the 64 squares. Pawn structure comes
+from a PawnHashTable (see pawns.py), and an Evaluator can also cache whole
+evaluations by position key (see eval_cache.py).
+"""
+
+from ..constant import WHITE, BLACK, KNIGHT, BISHOP, ROOK, QUEEN
+from ..bitboard import FULL, popcount, iter_indices
+from ..attacks import KNIGHT_ATTACKS, bishop_attacks, rook_attacks, queen_attacks
+from ..psqt import MATERIAL_VALUES, MAX_PHASE, tapered
+from .pawns import PawnHashTable, passed_pawn_scores, pawn_shield
+from .eval_cache import EvalCache
+
+__all__ = ['MATERIAL_VALUES', 'MOBILITY_WEIGHTS', 'Evaluator', 'material', 'positional', 'mobility',
+           'evaluate', 'evaluate_breakdown']
+
+# Centipawns per square a piece type attacks that isn't occupied by its own side
+MOBILITY_WEIGHTS = {KNIGHT: 4, BISHOP: 3, ROOK: 2, QUEEN: 1}
+
+# Attack lookup per piece type, all called as (square index, occupancy)
+_MOBILITY_ATTACKS = ((KNIGHT, lambda index, occupied: KNIGHT_ATTACKS[index]),
+                     (BISHOP, bishop_attacks), (ROOK, rook_attacks), (QUEEN, queen_attacks))
+
+# Used by evaluate() / evaluate_breakdown() when no table is passed
+_default_pawn_table = PawnHashTable()
+
+
+def material(board):
+    """Material balance in centipawns, white minus black."""
+    return board.material
+
+
+def positional(board):
+    """Piece-square score, middlegame and endgame tables blended by game phase."""
+    return tapered(board.psqt_mg, board.psqt_eg, board.phase)
+
+
+def mobility(board):
+    """
+    Mobility proxy, white minus black: for each piece type, the squares its
+    pieces attack together (counted once) that aren't blocked by its own
+    side, times MOBILITY_WEIGHTS. Attacks come per piece from the tables in
+    chess/attacks.py.
+    """
+    occupied = board.occupied
+    score = 0
+    for color, sign in ((WHITE, 1), (BLACK, -1)):
+        pieces = board.bitboards[color]
+        targets = FULL ^ board.occupancy[color]
+        total = 0
+        for name, attacks in _MOBILITY_ATTACKS:
+            bb = pieces[name]
+            if bb:
+                covered = 0
+                for index in iter_indices(bb):
+                    covered |= attacks(index, occupied)
+                total += MOBILITY_WEIGHTS[name] * popcount(covered & targets)
+        score += sign * total
+    return score
+
+
+def _pawn_terms(board, pawn_table):
+    """(structure, passed pawns, pawn shield), each white minus black."""
+    structure, passed_white, passed_black = pawn_table.probe(board)
+    passed_mg, passed_eg = passed_pawn_scores(passed_white, passed_black)
+    phase = min(board.phase, MAX_PHASE)
+    passed = tapered(passed_mg, passed_eg, phase)
+    shield = pawn_shield(board) * phase // MAX_PHASE
+    return structure, passed, shield
+
+
+def evaluate(board, pawn_table=None):
+    """Evaluate the position in centipawns from white's point of view."""
+    structure, passed, shield = _pawn_terms(board, pawn_table or _default_pawn_table)
+    return (board.material + tapered(board.psqt_mg, board.psqt_eg, board.phase) +
+            structure + passed + shield + mobility(board))
+
+
+def evaluate_breakdown(board, pawn_table=None):
+    """
+    evaluate() with its terms, in the shape the move-analysis printer reads:
+
+        value                 total, as evaluate() returns it
+        raw_material          material balance
+        positional_score      everything that isn't material
+        evaluation_breakdown  {category: centipawns}, summing to value
+    """
+    raw_material = material(board)
+    piece_squares = positional(board)
+    structure, passed, shield = _pawn_terms(board, pawn_table or _default_pawn_table)
+    mobility_score = mobility(board)
+    positional_score = piece_squares + structure + passed + shield + mobility_score
+    return {
+        'value': raw_material + positional_score,
+        'raw_material': raw_material,
+        'positional_score': positional_score,
+        'evaluation_breakdown': {
+            'material': raw_material,
+            'piece_squares': piece_squares,
+            'pawn_structure': structure,
+            'passed_pawns': passed,
+            'pawn_shield': shield,
+            'mobility': mobility_score,
+        },
+        'phase': min(board.phase, MAX_PHASE),
+    }
+
+
+class Evaluator:
+    """
+    evaluate() with its own caches, for one engine (or one process).
+
+    Call it like the evaluate function; stats() reports cache hit rates.
+
+    Args:
+        pawn_hash_mb: Size of the pawn structure cache
+        eval_cache_mb: Size of the whole-position evaluation cache (0 = none)
+    """
+
+    def __init__(self, pawn_hash_mb=1, eval_cache_mb=4):
+        self.pawn_table = PawnHashTable(pawn_hash_mb)
+        self.eval_cache = EvalCache(eval_cache_mb) if eval_cache_mb else None
+
+    def __call__(self, board):
+        if self.eval_cache is None:
+            return evaluate(board, self.pawn_table)
+        return self.eval_cache.evaluate(board, lambda b: evaluate(b, self.pawn_table))
+
+    def breakdown(self, board):
+        return evaluate_breakdown(board, self.pawn_table)
+
+    def stats(self):
+        stats = {'pawn_hash': self.pawn_table.stats()}
+        if self.eval_cache is not None:
+            stats['eval_cache'] = self.eval_cache.stats()
+        return stats
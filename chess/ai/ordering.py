@@ -0,0 +1,104 @@
+# chess/ai/ordering.py
+"""
+Move ordering for alpha-beta.
+
+Moves are tried in this order:
+1. the transposition-table move,
+2. captures and promotions, most valuable victim / least valuable attacker
+   first (using Piece.value),
+3. the two killer moves of this ply (quiet moves that caused a cutoff in a
+   sibling node),
+4. remaining quiet moves by butterfly history (how often a from/to pair
+   caused cutoffs anywhere in the tree).
+"""
+
+from ..constant import WHITE, BLACK, BOARD_SIZE
+
+TT_MOVE_SCORE = 1_000_000
+CAPTURE_SCORE = 100_000
+KILLER_SCORES = (90_000, 80_000)
+HISTORY_MAX = 50_000   # halve the table when an entry passes this, staying below killers
+
+PROMOTION_VALUES = {'queen': 9, 'rook': 5, 'bishop': 3, 'knight': 3}
+
+
+class MoveOrderer:
+    def __init__(self, max_ply=128):
+        self.max_ply = max_ply
+        self.killers = [[None, None] for _ in range(max_ply)]
+        self.history = {color: [[0] * 64 for _ in range(64)] for color in (WHITE, BLACK)}
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def new_search(self):
+        """Forget killers from the previous search and age the history scores."""
+        self.killers = [[None, None] for _ in range(self.max_ply)]
+        self._age_history()
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order(self, board, moves, tt_move=None, ply=0):
+        """Sort `moves` in place, best candidates first, and return it."""
+        squares = board.squares
+        killer_1, killer_2 = self.killers[ply]
+        history = self.history[board.current_player]
+
+        def score(move):
+            if move == tt_move:
+                return TT_MOVE_SCORE
+            from_row, from_col = move.from_pos
+            to_row, to_col = move.to_pos
+            victim = squares[to_row][to_col].piece
+            if victim is not None or move.is_en_passant or move.promotion:
+                attacker = squares[from_row][from_col].piece
+                victim_value = abs(victim.value) if victim is not None else (1 if move.is_en_passant else 0)
+                if move.promotion:
+                    victim_value += PROMOTION_VALUES[move.promotion]
+                return CAPTURE_SCORE + 100 * victim_value - abs(attacker.value)
+            if move == killer_1:
+                return KILLER_SCORES[0]
+            if move == killer_2:
+                return KILLER_SCORES[1]
+            return history[from_row * BOARD_SIZE + from_col][to_row * BOARD_SIZE + to_col]
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def record_cutoff(self, color, move, ply, depth, move_number, is_quiet):
+        """
+        Note a beta cutoff caused by `move`, the `move_number`-th move tried
+        (0 = first). Quiet moves become killers and earn history credit.
+        """
+        self.cutoffs += 1
+        if move_number == 0:
+            self.first_move_cutoffs += 1
+        if not is_quiet:
+            return
+
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        from_row, from_col = move.from_pos
+        to_row, to_col = move.to_pos
+        row = self.history[color][from_row * BOARD_SIZE + from_col]
+        row[to_row * BOARD_SIZE + to_col] += depth * depth
+        if row[to_row * BOARD_SIZE + to_col] > HISTORY_MAX:
+            self._age_history()
+
+    def first_move_cutoff_rate(self):
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    def stats(self):
+        return {
+            'cutoffs': self.cutoffs,
+            'first_move_cutoffs': self.first_move_cutoffs,
+            'first_move_cutoff_rate': round(self.first_move_cutoff_rate(), 4),
+        }
+
+    def _age_history(self):
+        for table in self.history.values():
+            for row in table:
+                for index in range(64):
+                    row[index] >>= 1
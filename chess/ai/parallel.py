@@ -0,0 +1,194 @@
+# chess/ai/parallel.py
+"""
+Root-split parallel search over a process pool.
+
+A simpler alternative to Lazy SMP: every root move is searched as its own
+task in a ProcessPoolExecutor, and each iteration of iterative deepening
+works like this:
+
+1. The first move (last iteration's best) is searched alone with a full
+   window, to get a good alpha.
+2. The other moves are handed out at most `workers` at a time. Each task
+   carries the best score so far as its alpha, so when a result comes back
+   better, tasks submitted after it search with the tighter bound.
+3. A move whose score beats alpha gets an exact score (the window is open
+   above), and the best one becomes the root move.
+
+Tasks only carry FEN, a UCI move and numbers; each worker keeps its own
+SearchEngine and transposition table between tasks.
+"""
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from ..board import Board
+from .ordering import MoveOrderer
+from .search import SearchEngine, SearchResult, INFINITY, MATE_THRESHOLD, MAX_DEPTH
+
+# Set up in each worker process by _init_worker
+_engine = None
+_stop_event = None
+_generation = None      # shared counter, bumped by RootParallelEngine.clear()
+_seen_generation = 0
+
+
+def _init_worker(tt_size_mb, stop_event, generation, engine_options):
+    global _engine, _stop_event, _generation
+    from .transposition import TranspositionTable
+    _engine = SearchEngine(TranspositionTable(tt_size_mb), **engine_options)
+    _stop_event = stop_event
+    _generation = generation
+
+
+def _search_root_move(fen, uci, depth, alpha):
+    """
+    Worker task: play `uci` from `fen` and search the reply to depth - 1.
+
+    Returns:
+        (uci, score for the root side, pv as UCI strings, nodes, stopped)
+    """
+    global _seen_generation
+    if _generation.value != _seen_generation:
+        # The pool can't address workers one by one, so each clears itself on its next task
+        _engine.clear()
+        _seen_generation = _generation.value
+    board = Board.from_fen(fen)
+    move = board.parse_uci(uci)
+    board.make_move(move)
+    score, pv, nodes = _engine.search_subtree(board, depth - 1, -INFINITY, -alpha, ply=1,
+                                              stop_event=_stop_event)
+    return uci, -score, [uci] + [reply.uci() for reply in pv], nodes, _engine.stopped
+
+
+class RootParallelEngine:
+    """
+    SearchEngine look-alike that splits root moves across `workers` processes.
+
+    Drop-in for SearchEngine (SearchWorker builds one for parallel='root'); call
+    close() when done to shut the pool down. Workers see only the FEN, so
+    repetitions of earlier game positions are not detected.
+
+    Args:
+        workers: Pool size
+        tt_size_mb: Transposition table size in each worker
+        **engine_options: Passed to every worker's SearchEngine
+    """
+
+    def __init__(self, workers=2, tt_size_mb=16, **engine_options):
+        self.workers = max(1, workers)
+        # spawn, not fork: the GUI process has pygame and threads running
+        context = multiprocessing.get_context('spawn')
+        self._stop = context.Event()
+        self._generation = context.RawValue('q', 0)
+        self._pool = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_init_worker,
+                                         initargs=(tt_size_mb, self._stop, self._generation, engine_options))
+        self.ordering = MoveOrderer()
+        self.tasks = 0
+
+    def search(self, board, depth=None, time_limit_ms=None, nodes_limit=None, stop_event=None,
+               on_iteration=None):
+        """
+        Same contract as SearchEngine.search. Time and node limits and
+        stop_event are checked as results come in; an iteration cut short is
+        thrown away.
+        """
+        if depth is None:
+            if time_limit_ms is None and nodes_limit is None and stop_event is None:
+                raise ValueError("search needs a depth, time_limit_ms, nodes_limit or stop_event")
+            depth = MAX_DEPTH
+
+        start = time.perf_counter()
+        deadline = start + time_limit_ms / 1000 if time_limit_ms is not None else None
+        self._stop.clear()
+        self.tasks = 0
+        fen = board.to_fen()
+        moves = self.ordering.order(board, board.generate_legal_moves(), None, 0)
+        root_order = [move.uci() for move in moves]
+        by_uci = {move.uci(): move for move in moves}
+
+        best_move, score, pv, completed, nodes = None, 0, [], 0, 0
+        if not root_order:
+            return SearchResult(None, 0, 0, 0, time.perf_counter() - start, [], self.stats())
+
+        def out_of_budget():
+            if stop_event is not None and stop_event.is_set():
+                return True
+            if completed == 0:
+                return False  # always finish depth 1
+            if nodes_limit is not None and nodes >= nodes_limit:
+                return True
+            return deadline is not None and time.perf_counter() >= deadline
+
+        for current_depth in range(1, min(depth, MAX_DEPTH) + 1):
+            scores = {}
+            best_uci, best_score, best_line = None, -INFINITY, []
+            pending = set()
+            queue = list(root_order)
+            aborted = False
+
+            while queue or pending:
+                # The first move runs alone to set alpha for the rest
+                limit = 1 if best_uci is None else self.workers
+                while queue and len(pending) < limit:
+                    alpha = best_score if best_uci is not None else -INFINITY
+                    pending.add(self._pool.submit(_search_root_move, fen, queue.pop(0), current_depth, alpha))
+                    self.tasks += 1
+                done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                for future in done:
+                    uci, move_score, line, move_nodes, stopped = future.result()
+                    nodes += move_nodes
+                    if stopped:
+                        aborted = True
+                        continue
+                    scores[uci] = move_score
+                    if best_uci is None or move_score > best_score:
+                        best_uci, best_score, best_line = uci, move_score, line
+                if not aborted and out_of_budget():
+                    aborted = True
+                if aborted:
+                    self._stop.set()
+                    queue = []
+            if aborted:
+                break
+
+            score = best_score
+            best_move = by_uci[best_uci]
+            pv = self._line_to_moves(board, best_line)
+            completed = current_depth
+            if on_iteration is not None:
+                on_iteration(SearchResult(best_move, score, completed, nodes, time.perf_counter() - start,
+                                          pv, self.stats()))
+
+            # Next iteration: best move first, the rest by this iteration's scores
+            root_order.sort(key=lambda uci: (uci != best_uci, -scores.get(uci, -INFINITY)))
+            if abs(score) >= MATE_THRESHOLD or out_of_budget():
+                break
+
+        return SearchResult(best_move, score, completed, nodes, time.perf_counter() - start, pv, self.stats())
+
+    def stats(self):
+        return {'parallel': {'mode': 'root', 'workers': self.workers, 'tasks': self.tasks}}
+
+    def clear(self):
+        """Empty every worker's transposition table (each does it before its next task)."""
+        self._generation.value += 1
+        self.ordering = MoveOrderer()
+
+    def close(self):
+        self._stop.set()
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _line_to_moves(self, board, line):
+        """Turn a PV of UCI strings back into Moves, checking each is legal."""
+        moves = []
+        for uci in line:
+            try:
+                move = board.parse_uci(uci)
+            except ValueError:
+                break
+            board.make_move(move)
+            moves.append(move)
+        for _ in moves:
+            board.unmake_move()
+        return moves
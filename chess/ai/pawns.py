@@ -0,0 +1,158 @@
+# chess/ai/pawns.py
+"""
+Pawn structure evaluation with a pawn hash table.
+
+Doubled, isolated and passed pawns depend only on where the pawns are, and
+pawns rarely move between sibling nodes, so the result is cached per pawn
+configuration under Board.pawn_key (a Zobrist key over pawns only).
+
+An entry holds the structure score (doubled and isolated pawns) and each
+side's passed-pawn mask. The passed-pawn bonus and the king's pawn shield
+also depend on game phase or the king square, so evaluation computes them
+from the cached masks and the pawn bitboards rather than caching them.
+"""
+
+from ..constant import WHITE, BLACK, PAWN, KING, BOARD_SIZE
+from ..bitboard import FILE_A, popcount, iter_indices, lsb_index
+from .transposition import CacheStats, power_of_two_slots
+
+DOUBLED_PENALTY = 15    # per extra pawn on a file
+ISOLATED_PENALTY = 12   # per pawn with no friendly pawn on a neighbouring file
+SHIELD_BONUS = 10       # per pawn in front of a castled king (middlegame only)
+
+# Passed pawn bonus by relative rank (0 = own back rank, 7 = promotion rank)
+PASSED_MG = (0, 5, 10, 15, 25, 40, 60, 0)
+PASSED_EG = (0, 10, 20, 35, 60, 100, 150, 0)
+
+# Rough cost of one slot in CPython (list pointer plus a 4-tuple of ints)
+PAWN_ENTRY_BYTES = 160
+
+FILE_MASKS = [FILE_A << col for col in range(BOARD_SIZE)]
+ADJACENT_FILES = [(FILE_MASKS[col - 1] if col > 0 else 0) | (FILE_MASKS[col + 1] if col < 7 else 0)
+                  for col in range(BOARD_SIZE)]
+
+
+def _rows_mask(rows):
+    mask = 0
+    for row in rows:
+        mask |= 0xFF << (row * BOARD_SIZE)
+    return mask
+
+
+def _passed_mask(color, index):
+    """Squares ahead of a pawn on its own and the adjacent files."""
+    row, col = divmod(index, BOARD_SIZE)
+    ahead = range(0, row) if color == WHITE else range(row + 1, BOARD_SIZE)
+    return _rows_mask(ahead) & (FILE_MASKS[col] | ADJACENT_FILES[col])
+
+
+def _shield_mask(color, index):
+    """The two ranks in front of a king on its first two ranks, on its file and the neighbours."""
+    row, col = divmod(index, BOARD_SIZE)
+    if color == WHITE:
+        if row < 6:
+            return 0
+        rows = (row - 1, row - 2)
+    else:
+        if row > 1:
+            return 0
+        rows = (row + 1, row + 2)
+    return _rows_mask(rows) & (FILE_MASKS[col] | ADJACENT_FILES[col])
+
+
+PASSED_MASKS = {color: [_passed_mask(color, index) for index in range(64)] for color in (WHITE, BLACK)}
+SHIELD_MASKS = {color: [_shield_mask(color, index) for index in range(64)] for color in (WHITE, BLACK)}
+
+
+def relative_rank(color, index):
+    """0 on the color's back rank up to 7 on its promotion rank."""
+    row = index // BOARD_SIZE
+    return 7 - row if color == WHITE else row
+
+
+def pawn_structure(board):
+    """
+    Compute the cacheable pawn terms from scratch.
+
+    Returns:
+        (structure score white minus black, white passed mask, black passed mask)
+    """
+    score = 0
+    passed = {}
+    for color, sign in ((WHITE, 1), (BLACK, -1)):
+        pawns = board.bitboards[color][PAWN]
+        enemy_pawns = board.bitboards[BLACK if color == WHITE else WHITE][PAWN]
+        penalty = 0
+        for col in range(BOARD_SIZE):
+            count = popcount(pawns & FILE_MASKS[col])
+            if count > 1:
+                penalty += DOUBLED_PENALTY * (count - 1)
+            if count and not pawns & ADJACENT_FILES[col]:
+                penalty += ISOLATED_PENALTY * count
+        score -= sign * penalty
+
+        passed_mask = 0
+        for index in iter_indices(pawns):
+            if not PASSED_MASKS[color][index] & enemy_pawns:
+                passed_mask |= 1 << index
+        passed[color] = passed_mask
+    return score, passed[WHITE], passed[BLACK]
+
+
+def passed_pawn_scores(passed_white, passed_black):
+    """Middlegame and endgame passed-pawn bonus, white minus black."""
+    mg = eg = 0
+    for color, mask, sign in ((WHITE, passed_white, 1), (BLACK, passed_black, -1)):
+        for index in iter_indices(mask):
+            rank = relative_rank(color, index)
+            mg += sign * PASSED_MG[rank]
+            eg += sign * PASSED_EG[rank]
+    return mg, eg
+
+
+def pawn_shield(board):
+    """Pawn shield bonus white minus black (apply in the middlegame only)."""
+    score = 0
+    for color, sign in ((WHITE, 1), (BLACK, -1)):
+        king = board.bitboards[color][KING]
+        if king:
+            shield = SHIELD_MASKS[color][lsb_index(king)] & board.bitboards[color][PAWN]
+            score += sign * SHIELD_BONUS * popcount(shield)
+    return score
+
+
+class PawnHashTable(CacheStats):
+    """
+    Direct-mapped cache of pawn_structure() results keyed by Board.pawn_key.
+
+    Args:
+        size_mb: Approximate memory budget in megabytes
+    """
+
+    def __init__(self, size_mb=1):
+        self.size_mb = size_mb
+        self.slot_count = power_of_two_slots(size_mb, PAWN_ENTRY_BYTES)
+        self.mask = self.slot_count - 1
+        self.slots = [None] * self.slot_count
+        self._reset_counters()
+
+    def probe(self, board):
+        """
+        Return (structure score, white passed mask, black passed mask) for the
+        board's pawns, computing and storing it on a miss.
+        """
+        key = board.pawn_key
+        index = key & self.mask
+        entry = self.slots[index]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1], entry[2], entry[3]
+        self.misses += 1
+        self.stores += 1
+        score, passed_white, passed_black = pawn_structure(board)
+        self.slots[index] = (key, score, passed_white, passed_black)
+        return score, passed_white, passed_black
+
+    def clear(self):
+        self.slots = [None] * self.slot_count
+        self._reset_counters()
@@ -0,0 +1,459 @@
+# chess/ai/search.py
+"""
+Negamax alpha-beta search with iterative deepening.
+
+The engine searches the board it is given in place, walking the tree with
+Board.make_move / Board.unmake_move, and leaves it exactly as it found it.
+"""
+
+import time
+
+from ..constant import WHITE, KNIGHT, BISHOP, ROOK, QUEEN
+from .evaluation import Evaluator
+from .transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from .ordering import MoveOrderer
+
+INFINITY = 1_000_000
+MATE_SCORE = 100_000
+# Scores beyond this are "mate in N"; they are stored in the transposition
+# table relative to the node so they stay correct at other plies.
+MATE_THRESHOLD = MATE_SCORE - 1000
+MAX_PLY = 128
+MAX_DEPTH = 64
+
+# How often (in nodes) the time and node limits are checked: about every
+# 20 ms at the few thousand nodes per second this engine searches
+CHECK_INTERVAL = 128
+
+# Null-move pruning: only at this depth or more, reduced by R (R + 1 when deep)
+NULL_MOVE_MIN_DEPTH = 3
+NULL_MOVE_REDUCTION = 2
+NULL_MOVE_DEEP_DEPTH = 7
+
+# Late move reductions: quiet moves after the first LMR_MIN_MOVES are searched
+# one ply shallower (two when very late) at depth LMR_MIN_DEPTH or more
+LMR_MIN_DEPTH = 3
+LMR_MIN_MOVES = 3
+LMR_LATE_MOVES = 10
+
+# Aspiration windows: from this depth the root is searched in a window of
+# +/- ASPIRATION_WINDOW around the previous iteration's score, doubling the
+# failed side until it passes ASPIRATION_MAX, then opening it fully
+ASPIRATION_MIN_DEPTH = 3
+ASPIRATION_WINDOW = 50
+ASPIRATION_MAX = 800
+
+
+class SearchResult:
+    """Outcome of SearchEngine.search."""
+
+    def __init__(self, best_move, score, depth, nodes, elapsed, pv, stats=None):
+        self.best_move = best_move
+        self.score = score        # centipawns for the side to move
+        self.depth = depth        # last completed iteration
+        self.nodes = nodes
+        self.elapsed = elapsed    # seconds
+        self.nps = nodes / elapsed if elapsed > 0 else 0.0
+        self.pv = pv              # principal variation, list of Move
+        self.stats = stats or {}  # counters from the table, move ordering, ...
+
+    def __repr__(self):
+        pv = ' '.join(move.uci() for move in self.pv)
+        return (f'SearchResult(move={self.best_move}, score={self.score}, depth={self.depth}, '
+                f'nodes={self.nodes}, nps={self.nps:.0f}, pv=[{pv}])')
+
+
+class SearchEngine:
+    """
+    Args:
+        transposition_table: Shared TranspositionTable (a private 16 MB one if omitted)
+        evaluate: Function(board) -> centipawns from white's point of view (a
+            private Evaluator, with its own pawn hash, if omitted)
+        null_move: Enable null-move pruning
+        late_move_reductions: Enable late move reductions
+        pvs: Principal variation search (null windows after the first move)
+        aspiration: Aspiration windows around the previous iteration's score
+    """
+
+    def __init__(self, transposition_table=None, evaluate=None, null_move=True,
+                 late_move_reductions=True, pvs=True, aspiration=True):
+        self.tt = transposition_table if transposition_table is not None else TranspositionTable()
+        self.evaluate = evaluate if evaluate is not None else Evaluator()
+        self.null_move = null_move
+        self.late_move_reductions = late_move_reductions
+        self.pvs = pvs
+        self.aspiration = aspiration
+        self.ordering = MoveOrderer(MAX_PLY)
+        self.nodes = 0
+        self.null_move_tries = 0
+        self.null_move_cutoffs = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.pvs_researches = 0
+        self.aspiration_researches = 0
+        self.pv_table = [[None] * MAX_PLY for _ in range(MAX_PLY)]
+        self.pv_length = [0] * MAX_PLY
+
+        # Limits for the running search
+        self.deadline = None       # perf_counter() value, or None
+        self.nodes_limit = None
+        self.stopped = False
+        self._can_stop = False     # never abort before depth 1 has a move
+        self.stop_event = None     # threading.Event that aborts the search outright
+
+    def search(self, board, depth=None, time_limit_ms=None, nodes_limit=None, stop_event=None,
+               on_iteration=None, start_depth=1):
+        """
+        Search the side to move with iterative deepening.
+
+        Each iteration goes one ply deeper until `depth` is reached, the time
+        or node budget runs out, or the next iteration is not expected to
+        finish in the time left. An iteration cut short is thrown away; the
+        result always comes from the last completed one.
+
+        Args:
+            depth: Maximum depth (defaults to MAX_DEPTH when a limit is given)
+            time_limit_ms: Wall-clock budget in milliseconds
+            nodes_limit: Node budget
+            stop_event: threading.Event; once set the search aborts as soon as
+                it notices, even before depth 1 completes. With no depth or
+                limits the search runs until this is set (pondering).
+            on_iteration: Called with a SearchResult after every completed iteration
+            start_depth: First iteration's depth (Lazy SMP helpers start deeper
+                than the main search so they explore different parts of the tree)
+
+        Returns:
+            SearchResult (best_move is None if there are no legal moves)
+        """
+        if depth is None:
+            if time_limit_ms is None and nodes_limit is None and stop_event is None:
+                raise ValueError("search needs a depth, time_limit_ms, nodes_limit or stop_event")
+            depth = MAX_DEPTH
+
+        self.nodes = 0
+        self.null_move_tries = self.null_move_cutoffs = 0
+        self.lmr_reductions = self.lmr_researches = 0
+        self.pvs_researches = self.aspiration_researches = 0
+        start = time.perf_counter()
+        self.deadline = start + time_limit_ms / 1000 if time_limit_ms is not None else None
+        self.nodes_limit = nodes_limit
+        self.stop_event = stop_event
+        self.stopped = False
+        self._can_stop = False
+        self.ordering.new_search()
+        best_move, score, pv, completed = None, 0, [], 0
+        iteration_times = []
+
+        for current_depth in range(min(start_depth, depth), min(depth, MAX_DEPTH) + 1):
+            iteration_start = time.perf_counter()
+            if self.aspiration and current_depth >= ASPIRATION_MIN_DEPTH and abs(score) < MATE_THRESHOLD:
+                iteration_score = self._aspiration_search(board, current_depth, score)
+            else:
+                iteration_score = self._negamax(board, current_depth, -INFINITY, INFINITY, 0)
+            if self.stopped:
+                break
+
+            score = iteration_score
+            pv = self.pv_table[0][:self.pv_length[0]]
+            completed = current_depth
+            self._can_stop = True
+            if pv:
+                best_move = pv[0]
+            iteration_times.append(time.perf_counter() - iteration_start)
+            if on_iteration is not None:
+                on_iteration(SearchResult(best_move, score, completed, self.nodes,
+                                          time.perf_counter() - start, pv, self.stats()))
+
+            # A forced mate won't change with more depth
+            if abs(score) >= MATE_THRESHOLD:
+                break
+            if not self._next_iteration_fits(iteration_times):
+                break
+
+        return SearchResult(best_move, score, completed, self.nodes, time.perf_counter() - start, pv,
+                            self.stats())
+
+    def search_subtree(self, board, depth, alpha, beta, ply=1, stop_event=None):
+        """
+        One fixed-depth alpha-beta search of `board` with the window
+        (alpha, beta), for callers that drive the root themselves (root-split
+        parallel search). `ply` is the distance from their root, so mate
+        scores come back relative to it.
+
+        Returns:
+            (score, pv, nodes); pv continues from `board`. If stop_event
+            fires the score is meaningless and `stopped` is set.
+        """
+        self.nodes = 0
+        self.deadline = None
+        self.nodes_limit = None
+        self.stop_event = stop_event
+        self.stopped = False
+        self._can_stop = False
+        score = self._negamax(board, depth, alpha, beta, ply)
+        pv = self.pv_table[ply][ply:self.pv_length[ply]]
+        return score, pv, self.nodes
+
+    def clear(self):
+        """Forget earlier searches: empty the transposition table and reset move ordering."""
+        self.tt.clear()
+        self.ordering = MoveOrderer(MAX_PLY)
+
+    def stats(self):
+        return {
+            'transposition_table': self.tt.stats(),
+            'evaluation': self.evaluate.stats() if hasattr(self.evaluate, 'stats') else {},
+            'move_ordering': self.ordering.stats(),
+            'pruning': {
+                'null_move_tries': self.null_move_tries,
+                'null_move_cutoffs': self.null_move_cutoffs,
+                'lmr_reductions': self.lmr_reductions,
+                'lmr_researches': self.lmr_researches,
+            },
+            'windows': {
+                'pvs_researches': self.pvs_researches,
+                'aspiration_researches': self.aspiration_researches,
+            },
+        }
+
+    def _next_iteration_fits(self, iteration_times):
+        """
+        Predict the next iteration's duration from the growth between the last
+        two (the effective branching factor) and check it against the deadline.
+        """
+        if self.deadline is None:
+            return True
+        last = iteration_times[-1]
+        if len(iteration_times) >= 2 and iteration_times[-2] > 0:
+            branching = min(max(last / iteration_times[-2], 2.0), 10.0)
+        else:
+            branching = 4.0
+        return time.perf_counter() + last * branching <= self.deadline
+
+    def _check_limits(self):
+        if self.stop_event is not None and self.stop_event.is_set():
+            self.stopped = True
+            return
+        if not self._can_stop:
+            return
+        if self.nodes_limit is not None and self.nodes >= self.nodes_limit:
+            self.stopped = True
+        elif self.deadline is not None and time.perf_counter() >= self.deadline:
+            self.stopped = True
+
+    # ============================================================================
+    # TREE SEARCH
+    # ============================================================================
+
+    def _aspiration_search(self, board, depth, guess):
+        """
+        Search the root in a narrow window around `guess`. A score outside the
+        window is only a bound, so the failed side is widened and the root
+        searched again.
+        """
+        delta = ASPIRATION_WINDOW
+        alpha, beta = guess - delta, guess + delta
+        while True:
+            score = self._negamax(board, depth, alpha, beta, 0)
+            if self.stopped:
+                return score
+            if score <= alpha:
+                alpha = guess - delta * 2 if delta * 2 <= ASPIRATION_MAX else -INFINITY
+            elif score >= beta:
+                beta = guess + delta * 2 if delta * 2 <= ASPIRATION_MAX else INFINITY
+            else:
+                return score
+            delta *= 2
+            self.aspiration_researches += 1
+
+    def _negamax(self, board, depth, alpha, beta, ply, allow_null=True):
+        self.nodes += 1
+        self.pv_length[ply] = ply
+        if self.nodes % CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        if ply > 0 and (board.halfmove_clock >= 100 or self._is_repetition(board)):
+            return 0
+
+        key = board.zobrist_key
+        entry = self.tt.probe(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry.best_move
+            if ply > 0 and entry.depth >= depth:
+                score = score_from_tt(entry.score, ply)
+                if (entry.bound == EXACT or
+                        (entry.bound == LOWER_BOUND and score >= beta) or
+                        (entry.bound == UPPER_BOUND and score <= alpha)):
+                    return score
+
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            return self._quiescence(board, alpha, beta, ply)
+
+        in_check = board.is_in_check(board.current_player)
+
+        # Null move: if passing the turn still fails high, a real move will too.
+        # Not in check (passing would be illegal), not right after another null
+        # move, and not with only king and pawns, where zugzwang is common and
+        # passing is really the best "move".
+        if (self.null_move and allow_null and ply > 0 and not in_check and
+                depth >= NULL_MOVE_MIN_DEPTH and beta < MATE_THRESHOLD and
+                self._has_non_pawn_material(board)):
+            reduction = NULL_MOVE_REDUCTION + (1 if depth >= NULL_MOVE_DEEP_DEPTH else 0)
+            self.null_move_tries += 1
+            board.make_null_move()
+            score = -self._negamax(board, depth - 1 - reduction, -beta, -beta + 1, ply + 1,
+                                   allow_null=False)
+            board.unmake_null_move()
+            if self.stopped:
+                return 0
+            if score >= beta:
+                # Verification: a reduced search of this node without null moves
+                # must fail high as well, which catches the zugzwangs the
+                # material guard lets through.
+                verified = self._negamax(board, depth - reduction, beta - 1, beta, ply,
+                                         allow_null=False)
+                if self.stopped:
+                    return 0
+                if verified >= beta:
+                    self.null_move_cutoffs += 1
+                    # Don't trust a mate found after passing the turn
+                    return beta if score >= MATE_THRESHOLD else score
+                self.pv_length[ply] = ply
+
+        moves = board.generate_legal_moves()
+        if not moves:
+            if in_check:
+                return -MATE_SCORE + ply
+            return 0  # stalemate
+
+        self.ordering.order(board, moves, tt_move, ply)
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = None
+        squares = board.squares
+        for move_number, move in enumerate(moves):
+            is_quiet = (squares[move.to_pos[0]][move.to_pos[1]].piece is None and
+                        not move.is_en_passant and not move.promotion)
+            board.make_move(move)
+
+            # Late quiet moves are unlikely to be best: try them shallower with
+            # a null window first and only search them fully if they beat alpha.
+            reduction = 0
+            if (self.late_move_reductions and depth >= LMR_MIN_DEPTH and
+                    move_number >= LMR_MIN_MOVES and is_quiet and not in_check and
+                    not board.is_in_check(board.current_player)):
+                reduction = 2 if move_number >= LMR_LATE_MOVES and depth >= 5 else 1
+
+            if move_number == 0:
+                score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            else:
+                score = alpha + 1  # anything above alpha falls through to the next search
+                if reduction:
+                    self.lmr_reductions += 1
+                    score = -self._negamax(board, depth - 1 - reduction, -alpha - 1, -alpha, ply + 1)
+                    if score > alpha:
+                        self.lmr_researches += 1
+                # PVS: prove the move is no better than alpha with a null window,
+                # and only search it with the full window if that fails
+                if score > alpha and self.pvs:
+                    score = -self._negamax(board, depth - 1, -alpha - 1, -alpha, ply + 1)
+                    if alpha < score < beta:
+                        self.pvs_researches += 1
+                if score > alpha and (score < beta or not self.pvs):
+                    score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if self.stopped:
+                return 0
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    self._update_pv(ply, move)
+                    if alpha >= beta:
+                        self.ordering.record_cutoff(board.current_player, move, ply, depth,
+                                                    move_number, is_quiet)
+                        break
+
+        if best_score >= beta:
+            bound = LOWER_BOUND
+        elif best_score > original_alpha:
+            bound = EXACT
+        else:
+            bound = UPPER_BOUND
+        self.tt.store(key, depth, score_to_tt(best_score, ply), bound, best_move)
+        return best_score
+
+    def _quiescence(self, board, alpha, beta, ply):
+        """
+        Resolve captures and promotions at the horizon so leaves are only
+        evaluated in quiet positions. The side to move may always "stand pat"
+        on the static evaluation instead of capturing.
+        """
+        self.nodes += 1
+        self.pv_length[ply] = ply
+        if self.nodes % CHECK_INTERVAL == 0:
+            self._check_limits()
+
+        stand_pat = self.evaluate(board)
+        if board.current_player != WHITE:
+            stand_pat = -stand_pat
+        if stand_pat >= beta or ply >= MAX_PLY - 1:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        captures = board.generate_legal_moves(captures_only=True)
+        for move in self.ordering.order(board, captures, None, ply):
+            board.make_move(move)
+            score = -self._quiescence(board, -beta, -alpha, ply + 1)
+            board.unmake_move()
+            if self.stopped:
+                return 0
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def _has_non_pawn_material(self, board):
+        pieces = board.bitboards[board.current_player]
+        return bool(pieces[KNIGHT] | pieces[BISHOP] | pieces[ROOK] | pieces[QUEEN])
+
+    def _update_pv(self, ply, move):
+        row = self.pv_table[ply]
+        child = self.pv_table[ply + 1]
+        row[ply] = move
+        length = self.pv_length[ply + 1]
+        row[ply + 1:length] = child[ply + 1:length]
+        self.pv_length[ply] = max(length, ply + 1)
+
+    def _is_repetition(self, board):
+        """True if the current position already occurred since the last irreversible move."""
+        key = board.zobrist_key
+        stack = board.move_stack
+        limit = min(board.halfmove_clock, len(stack))
+        for back in range(2, limit + 1, 2):
+            if stack[-back].zobrist_key == key:
+                return True
+        return False
+
+
+def score_to_tt(score, ply):
+    """Make a mate score relative to the current node before storing it."""
+    if score >= MATE_THRESHOLD:
+        return score + ply
+    if score <= -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def score_from_tt(score, ply):
+    if score >= MATE_THRESHOLD:
+        return score - ply
+    if score <= -MATE_THRESHOLD:
+        return score + ply
+    return score
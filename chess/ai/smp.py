@@ -0,0 +1,261 @@
+# chess/ai/smp.py
+"""
+Lazy SMP: several processes search the same root and share one
+transposition table.
+
+The GIL keeps threads from searching in parallel, so helpers are separate
+processes. They get the position as FEN, search it with no depth limit
+(each starting at a different depth so they don't walk in lockstep) and
+only communicate through the table: whatever they store speeds up the main
+search, whose result is the one played.
+
+The shared table lives in multiprocessing.shared_memory and is lockless.
+Each slot is two 64-bit words, (key ^ data, data). A reader accepts a slot
+only if the words XOR back to its key, so an entry half-written by another
+process reads as a miss instead of a corrupt hit.
+"""
+
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+
+from ..board import Board
+from ..move import Move
+from .transposition import TTEntry, CacheStats, power_of_two_slots
+from .search import SearchEngine, SearchResult
+
+# One slot: check word + data word
+SHARED_ENTRY_BYTES = 16
+
+# Data word layout (bit offsets)
+SCORE_BITS = 22
+SCORE_OFFSET = 1 << (SCORE_BITS - 1)   # scores are stored biased to be unsigned
+DEPTH_SHIFT = 22                       # 7 bits
+BOUND_SHIFT = 29                       # 2 bits
+MOVE_SHIFT = 31                        # 15 bits: from (6), to (6), promotion (3)
+VALID_BIT = 1 << 46                    # set on every entry so data is never 0
+MAX_STORED_DEPTH = 127
+
+PROMOTION_CODES = {None: 0, 'queen': 1, 'rook': 2, 'bishop': 3, 'knight': 4}
+PROMOTION_NAMES = {code: name for name, code in PROMOTION_CODES.items()}
+
+# How long to wait for helpers to report after a search is stopped
+HELPER_REPORT_TIMEOUT = 5.0
+
+
+def encode_move(move):
+    """Pack a Move into 15 bits (0 means no move)."""
+    if move is None:
+        return 0
+    from_index = move.from_pos[0] * 8 + move.from_pos[1]
+    to_index = move.to_pos[0] * 8 + move.to_pos[1]
+    return (from_index << 9) | (to_index << 3) | PROMOTION_CODES[move.promotion]
+
+
+def decode_move(code):
+    """
+    Inverse of encode_move. Castling and en passant flags are not stored;
+    the search only compares table moves against generated ones.
+    """
+    if code == 0:
+        return None
+    from_index, to_index = code >> 9, (code >> 3) & 63
+    return Move(divmod(from_index, 8), divmod(to_index, 8), PROMOTION_NAMES[code & 7])
+
+
+class SharedTranspositionTable(CacheStats):
+    """
+    Transposition table in shared memory, usable from several processes at once.
+
+    Same interface and replacement scheme as TranspositionTable (buckets of a
+    depth-preferred and an always-replace slot). Hit counters, and so stats(),
+    are per process.
+
+    Args:
+        size_mb: Memory budget in megabytes
+        name: Attach to an existing table's shared memory block instead of creating one
+    """
+
+    def __init__(self, size_mb=16, name=None):
+        self.size_mb = size_mb
+        self.bucket_count = power_of_two_slots(size_mb, 2 * SHARED_ENTRY_BYTES)
+        self.slot_count = 2 * self.bucket_count
+        self.mask = self.bucket_count - 1
+        size = self.bucket_count * 2 * SHARED_ENTRY_BYTES
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.name = self.shm.name
+        self.words = self.shm.buf.cast('Q')  # new blocks are zero-filled, i.e. empty
+        self._reset_counters()
+
+    def _read(self, index):
+        """(key, data) of the slot at word `index`, or (None, 0) if empty."""
+        data = self.words[index + 1]
+        if not data:
+            return None, 0
+        return self.words[index] ^ data, data
+
+    def probe(self, key):
+        """Return a TTEntry for this key, or None."""
+        index = (key & self.mask) << 2
+        for slot in (index, index + 2):
+            slot_key, data = self._read(slot)
+            if slot_key == key:
+                self.hits += 1
+                return TTEntry(key,
+                               (data >> DEPTH_SHIFT) & MAX_STORED_DEPTH,
+                               (data & ((1 << SCORE_BITS) - 1)) - SCORE_OFFSET,
+                               (data >> BOUND_SHIFT) & 3,
+                               decode_move((data >> MOVE_SHIFT) & 0x7FFF))
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, score, bound, best_move):
+        index = (key & self.mask) << 2
+        self.stores += 1
+        move_code = encode_move(best_move)
+
+        slot = index
+        slot_key, data = self._read(index)
+        if not (slot_key is None or slot_key == key or depth >= (data >> DEPTH_SHIFT) & MAX_STORED_DEPTH):
+            slot = index + 2
+            slot_key, data = self._read(slot)
+        # Keep the same move if this search didn't find one
+        if move_code == 0 and slot_key == key:
+            move_code = (data >> MOVE_SHIFT) & 0x7FFF
+
+        depth = min(max(depth, 0), MAX_STORED_DEPTH)
+        data = (VALID_BIT | (move_code << MOVE_SHIFT) | (bound << BOUND_SHIFT) |
+                (depth << DEPTH_SHIFT) | (score + SCORE_OFFSET))
+        self.words[slot + 1] = data
+        self.words[slot] = key ^ data
+
+    def clear(self):
+        self.shm.buf[:] = bytes(len(self.shm.buf))
+        self._reset_counters()
+
+    def close(self):
+        """Detach from the shared block; the creator also frees it."""
+        self.words.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _helper_main(table_name, tt_size_mb, tasks, results, stop_event, engine_options):
+    """Helper process: search whatever positions arrive until told to quit (None)."""
+    table = SharedTranspositionTable(tt_size_mb, name=table_name)
+    engine = SearchEngine(table, **engine_options)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            search_id, fen, start_depth = task
+            nodes = 0
+            if not stop_event.is_set():
+                result = engine.search(Board.from_fen(fen), stop_event=stop_event, start_depth=start_depth)
+                nodes = result.nodes
+            results.put((search_id, nodes))
+    finally:
+        table.close()
+
+
+class LazySMPEngine:
+    """
+    SearchEngine look-alike that runs `workers - 1` helper processes next to
+    the main search.
+
+    Drop-in for SearchEngine (SearchWorker builds one for workers > 1). The
+    returned SearchResult counts nodes from every process. Call close()
+    when done to stop the helpers and free the shared table.
+
+    Args:
+        workers: Total searching processes, including the caller's
+        tt_size_mb: Size of the shared transposition table
+        **engine_options: Passed to every SearchEngine (null_move, pvs, ...)
+    """
+
+    def __init__(self, workers=2, tt_size_mb=16, **engine_options):
+        self.workers = max(1, workers)
+        self.tt = SharedTranspositionTable(tt_size_mb)
+        self.engine = SearchEngine(self.tt, **engine_options)
+        # spawn, not fork: the GUI process has pygame and threads running
+        context = multiprocessing.get_context('spawn')
+        self._stop = context.Event()
+        self._results = context.Queue()
+        self._tasks = []
+        self._helpers = []
+        self._search_id = 0
+        for _ in range(self.workers - 1):
+            tasks = context.Queue()
+            helper = context.Process(
+                target=_helper_main, name='lazy-smp-helper', daemon=True,
+                args=(self.tt.name, tt_size_mb, tasks, self._results, self._stop, engine_options))
+            helper.start()
+            self._tasks.append(tasks)
+            self._helpers.append(helper)
+
+    @property
+    def ordering(self):
+        return self.engine.ordering
+
+    def search(self, board, depth=None, time_limit_ms=None, nodes_limit=None, stop_event=None,
+               on_iteration=None):
+        """Same contract as SearchEngine.search; helpers run until it returns."""
+        self._search_id += 1
+        self._stop.clear()
+        fen = board.to_fen()
+        for number, tasks in enumerate(self._tasks):
+            # Stagger start depths: 2, 3, 2, 3, ...
+            tasks.put((self._search_id, fen, 2 + number % 2))
+        try:
+            result = self.engine.search(board, depth=depth, time_limit_ms=time_limit_ms,
+                                        nodes_limit=nodes_limit, stop_event=stop_event,
+                                        on_iteration=on_iteration)
+        finally:
+            self._stop.set()
+
+        helper_nodes = self._collect_helper_nodes()
+        stats = dict(result.stats)
+        stats['smp'] = {'workers': self.workers, 'main_nodes': result.nodes, 'helper_nodes': helper_nodes}
+        return SearchResult(result.best_move, result.score, result.depth, result.nodes + helper_nodes,
+                            result.elapsed, result.pv, stats)
+
+    def stats(self):
+        return self.engine.stats()
+
+    def clear(self):
+        """Empty the shared table and reset the main search's move ordering."""
+        self.engine.clear()
+
+    def close(self):
+        self._stop.set()
+        for tasks in self._tasks:
+            tasks.put(None)
+        for helper in self._helpers:
+            helper.join(HELPER_REPORT_TIMEOUT)
+            if helper.is_alive():
+                helper.terminate()
+        self._helpers = []
+        self._tasks = []
+        self.tt.close()
+
+    def _collect_helper_nodes(self):
+        """Wait for every helper to report this search's node count."""
+        nodes = 0
+        pending = len(self._helpers)
+        while pending:
+            try:
+                search_id, helper_nodes = self._results.get(timeout=HELPER_REPORT_TIMEOUT)
+            except queue.Empty:
+                print("⚠️ Lazy SMP helper did not report back")
+                break
+            if search_id == self._search_id:
+                nodes += helper_nodes
+                pending -= 1
+        return nodes
@@ -0,0 +1,119 @@
+# chess/ai/transposition.py
+"""
+Fixed-size transposition table keyed by Board.zobrist_key.
+
+Entries live in buckets of two slots:
+- slot 0 is depth-preferred: only replaced by a search at least as deep
+  (or by the same position),
+- slot 1 is always-replace: takes whatever slot 0 turned down.
+"""
+
+# Bound types
+EXACT = 0
+LOWER_BOUND = 1   # score >= stored score (fail-high)
+UPPER_BOUND = 2   # score <= stored score (fail-low)
+
+# Rough cost of one slot in CPython: the list pointer plus a TTEntry with its
+# key and score ints. Used only to turn a megabyte budget into a slot count.
+ENTRY_BYTES = 128
+
+
+def power_of_two_slots(size_mb, entry_bytes):
+    """
+    The most slots of `entry_bytes` that fit in `size_mb` megabytes, rounded
+    down to a power of two (at least 1) so a slot index is a mask of the key.
+    """
+    slots = max(1, (size_mb * 1024 * 1024) // entry_bytes)
+    return 1 << (slots.bit_length() - 1)
+
+
+class CacheStats:
+    """
+    Hit, miss and store counters and the stats() dict every engine cache
+    reports. Subclasses set size_mb and slot_count and call _reset_counters().
+    """
+
+    def _reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    def hit_rate(self):
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    def stats(self):
+        """Counters for debug printing."""
+        return {
+            'size_mb': self.size_mb,
+            'slots': self.slot_count,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'hit_rate': round(self.hit_rate(), 4),
+        }
+
+
+class TTEntry:
+    __slots__ = ('key', 'depth', 'score', 'bound', 'best_move')
+
+    def __init__(self, key, depth, score, bound, best_move):
+        self.key = key
+        self.depth = depth
+        self.score = score
+        self.bound = bound
+        self.best_move = best_move
+
+    def __repr__(self):
+        return f'TTEntry(depth={self.depth}, score={self.score}, bound={self.bound}, move={self.best_move})'
+
+
+class TranspositionTable(CacheStats):
+    """
+    Args:
+        size_mb: Approximate memory budget in megabytes
+    """
+
+    def __init__(self, size_mb=16):
+        self.size_mb = size_mb
+        self.bucket_count = power_of_two_slots(size_mb, 2 * ENTRY_BYTES)
+        self.slot_count = 2 * self.bucket_count
+        self.mask = self.bucket_count - 1
+        self.slots = [None] * self.slot_count
+        self._reset_counters()
+
+    def probe(self, key):
+        """Return the entry stored for this key, or None."""
+        index = (key & self.mask) << 1
+        entry = self.slots[index]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        entry = self.slots[index + 1]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, score, bound, best_move):
+        index = (key & self.mask) << 1
+        slots = self.slots
+        self.stores += 1
+
+        preferred = slots[index]
+        if preferred is None or preferred.key == key or depth >= preferred.depth:
+            # Keep the same move if this search didn't find one
+            if best_move is None and preferred is not None and preferred.key == key:
+                best_move = preferred.best_move
+            slots[index] = TTEntry(key, depth, score, bound, best_move)
+            return
+
+        always = slots[index + 1]
+        if best_move is None and always is not None and always.key == key:
+            best_move = always.best_move
+        slots[index + 1] = TTEntry(key, depth, score, bound, best_move)
+
+    def clear(self):
+        self.slots = [None] * self.slot_count
+        self._reset_counters()
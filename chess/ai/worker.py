@@ -0,0 +1,212 @@
+# chess/ai/worker.py
+"""
+Background search so the pygame loop never blocks.
+
+The engine runs in its own process (spawn context, like smp.py and
+parallel.py): a search thread in the GUI process would hold the GIL most of
+the time and drag the frame rate down. The GUI submits a position, gets a
+SearchRequest back and polls it once per frame; the search process sends
+each finished iteration and the final result back on a queue.
+
+Because the engine lives in the other process, SearchWorker builds it from
+settings rather than taking an engine object. It is kept for the worker's
+lifetime, so its transposition table carries over from move to move.
+"""
+
+import atexit
+import multiprocessing
+import queue
+import time
+
+# How long shutdown(wait=True) gives the search process before killing it
+SHUTDOWN_TIMEOUT = 5.0
+
+
+class SearchRequest:
+    """
+    Handle for one background search.
+
+    Poll done() from the main loop; once it is True, `result` holds the
+    SearchResult (or `error` the exception) and `position_key` the Zobrist
+    key of the position searched. `latest` is the result of the last
+    completed iteration while the search is still running.
+
+    stop() ends the search early but keeps its result; cancel() aborts it
+    and marks the result as not to be used.
+    """
+
+    def __init__(self, worker, request_id, ponder_move=None):
+        self._worker = worker
+        self.request_id = request_id
+        self.ponder_move = ponder_move
+        self.position_key = None
+        self.result = None
+        self.latest = None
+        self.error = None
+        self.cancelled = False
+        self._finished = False
+
+    def done(self):
+        self._worker.poll()
+        return self._finished
+
+    def stop(self):
+        self._worker._stop(self.request_id)
+
+    def cancel(self):
+        self.cancelled = True
+        self.stop()
+
+    def wait(self, timeout=None):
+        """Block until the search finishes (mostly useful outside the GUI)."""
+        return self._worker._wait(self, timeout)
+
+
+class _StopFlag:
+    """stop_event look-alike for one request: set once the GUI has stopped it or any later one."""
+
+    def __init__(self, stop_id, request_id):
+        self.stop_id = stop_id
+        self.request_id = request_id
+
+    def is_set(self):
+        return self.stop_id.value >= self.request_id
+
+
+def _make_engine(workers, parallel, tt_size_mb, engine_options):
+    from .transposition import TranspositionTable
+    from .search import SearchEngine
+    if workers > 1 and parallel == 'root':
+        from .parallel import RootParallelEngine
+        return RootParallelEngine(workers, tt_size_mb, **engine_options)
+    if workers > 1:
+        from .smp import LazySMPEngine
+        return LazySMPEngine(workers, tt_size_mb, **engine_options)
+    return SearchEngine(TranspositionTable(tt_size_mb), **engine_options)
+
+
+def _search_main(settings, requests, results, stop_id):
+    """Search process: run requests one at a time until told to quit (None)."""
+    engine = _make_engine(*settings)
+    try:
+        while True:
+            request = requests.get()
+            if request is None:
+                return
+            request_id, board, ponder_move, depth, time_limit_ms, nodes_limit = request
+            if ponder_move is not None:
+                # Search the position after the reply we expect from the opponent
+                board.make_move(ponder_move)
+            key = board.zobrist_key
+            try:
+                result = engine.search(
+                    board, depth=depth, time_limit_ms=time_limit_ms, nodes_limit=nodes_limit,
+                    stop_event=_StopFlag(stop_id, request_id),
+                    on_iteration=lambda latest: results.put((request_id, 'iteration', key, latest)))
+                results.put((request_id, 'done', key, result))
+            except Exception as error:  # reported to the GUI via the request
+                results.put((request_id, 'error', key, error))
+    finally:
+        if hasattr(engine, 'close'):
+            engine.close()
+
+
+class SearchWorker:
+    """
+    Runs submitted searches one at a time in a background process.
+
+    Args:
+        workers: Searching processes; more than 1 uses a parallel engine
+        parallel: 'smp' (Lazy SMP) or 'root' (root moves split over a pool)
+        tt_size_mb: Transposition table size
+        **engine_options: Passed to SearchEngine (null_move, pvs, ...)
+    """
+
+    def __init__(self, workers=1, parallel='smp', tt_size_mb=16, **engine_options):
+        context = multiprocessing.get_context('spawn')
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        # Highest request id stopped so far; requests run in id order
+        self._stop_id = context.RawValue('q', 0)
+        self._next_id = 0
+        self._active = {}
+        # Not a daemon: parallel engines start processes of their own, which
+        # daemons may not. atexit makes sure it still goes away with the GUI.
+        self._process = context.Process(
+            target=_search_main, name='search-worker',
+            args=((workers, parallel, tt_size_mb, engine_options), self._requests, self._results, self._stop_id))
+        self._process.start()
+        atexit.register(self.shutdown, True)
+
+    def submit(self, board, depth=None, time_limit_ms=None, nodes_limit=None):
+        return self._submit(board, None, depth, time_limit_ms, nodes_limit)
+
+    def ponder(self, board, ponder_move):
+        """
+        Start searching the position after `ponder_move` with no limits; it
+        runs until the request is stopped or cancelled.
+        """
+        return self._submit(board, ponder_move, None, None, None)
+
+    def poll(self):
+        """Apply every message the search process has sent so far (never blocks)."""
+        while True:
+            try:
+                message = self._results.get_nowait()
+            except queue.Empty:
+                return
+            self._dispatch(message)
+
+    def shutdown(self, wait=False):
+        """Stop any running search and the process; `wait` blocks until it has exited."""
+        if self._process is None:
+            return
+        self._stop_id.value = self._next_id
+        self._requests.put(None)
+        if wait:
+            self._process.join(SHUTDOWN_TIMEOUT)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+    def _submit(self, board, ponder_move, depth, time_limit_ms, nodes_limit):
+        self._next_id += 1
+        request = SearchRequest(self, self._next_id, ponder_move)
+        self._active[request.request_id] = request
+        # The board is pickled here, so later changes to the live board don't reach the search
+        self._requests.put((request.request_id, board, ponder_move, depth, time_limit_ms, nodes_limit))
+        return request
+
+    def _stop(self, request_id):
+        if self._stop_id.value < request_id:
+            self._stop_id.value = request_id
+
+    def _wait(self, request, timeout):
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        self.poll()
+        while not request._finished:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                return False
+            try:
+                message = self._results.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            self._dispatch(message)
+        return True
+
+    def _dispatch(self, message):
+        request_id, kind, key, payload = message
+        request = self._active.get(request_id)
+        if request is None:
+            return
+        request.position_key = key
+        if kind == 'iteration':
+            request.latest = payload
+            return
+        if kind == 'done':
+            request.result = payload
+        else:
+            request.error = payload
+        request._finished = True
+        del self._active[request_id]
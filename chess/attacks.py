@@ -0,0 +1,102 @@
+# chess/attacks.py
+"""
+Precomputed attack tables, built once at import.
+
+Each table is a 64-entry list indexed by square (see chess.bitboard for the
+square numbering) holding the bitboard of squares attacked from there.
+"""
+
+from .constant import WHITE, BLACK
+from .bitboard import (knight_attacks, king_attacks, pawn_attacks,
+                       shift_north, shift_south, shift_east, shift_west,
+                       shift_north_east, shift_north_west, shift_south_east, shift_south_west)
+
+KNIGHT_ATTACKS = [knight_attacks(1 << index) for index in range(64)]
+KING_ATTACKS = [king_attacks(1 << index) for index in range(64)]
+PAWN_ATTACKS = {
+    WHITE: [pawn_attacks(1 << index, WHITE) for index in range(64)],
+    BLACK: [pawn_attacks(1 << index, BLACK) for index in range(64)],
+}
+
+
+# ============================================================================
+# SLIDING ATTACKS (ray tables)
+# ============================================================================
+# RAYS[direction][index] is every square from `index` to the board edge in
+# that direction, on an empty board. Against real occupancy we keep the ray
+# up to and including the first blocker, found with a single bit scan, so a
+# slider's attacks come out in one shot per direction.
+
+def _build_rays(shift):
+    rays = []
+    for index in range(64):
+        ray = 0
+        step = shift(1 << index)
+        while step:
+            ray |= step
+            step = shift(step)
+        rays.append(ray)
+    return rays
+
+
+NORTH, SOUTH, EAST, WEST = 'north', 'south', 'east', 'west'
+NORTH_EAST, NORTH_WEST, SOUTH_EAST, SOUTH_WEST = 'north_east', 'north_west', 'south_east', 'south_west'
+
+RAYS = {
+    NORTH: _build_rays(shift_north),
+    SOUTH: _build_rays(shift_south),
+    EAST: _build_rays(shift_east),
+    WEST: _build_rays(shift_west),
+    NORTH_EAST: _build_rays(shift_north_east),
+    NORTH_WEST: _build_rays(shift_north_west),
+    SOUTH_EAST: _build_rays(shift_south_east),
+    SOUTH_WEST: _build_rays(shift_south_west),
+}
+
+# Directions in which square indices grow; the nearest blocker is then the
+# lowest set bit, otherwise the highest.
+_ROOK_RAYS = ((RAYS[SOUTH], True), (RAYS[EAST], True), (RAYS[NORTH], False), (RAYS[WEST], False))
+_BISHOP_RAYS = ((RAYS[SOUTH_EAST], True), (RAYS[SOUTH_WEST], True),
+                (RAYS[NORTH_EAST], False), (RAYS[NORTH_WEST], False))
+
+# Every direction as (ray table, indices grow along it, diagonal), for code
+# that walks out from a square itself (pins and check blocks)
+DIRECTIONS = (tuple((table, positive, False) for table, positive in _ROOK_RAYS) +
+              tuple((table, positive, True) for table, positive in _BISHOP_RAYS))
+
+
+def nearest(blockers, positive):
+    """Index of the blocker closest to the ray's origin (see the direction flags above)."""
+    if positive:
+        return (blockers & -blockers).bit_length() - 1
+    return blockers.bit_length() - 1
+
+
+def _slider_attacks(index, occupied, rays):
+    attacks = 0
+    for table, positive in rays:
+        ray = table[index]
+        blockers = ray & occupied
+        if blockers:
+            if positive:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            ray ^= table[blocker]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(index, occupied):
+    """Squares a rook on `index` attacks, stopping at (and including) the first piece in each direction."""
+    return _slider_attacks(index, occupied, _ROOK_RAYS)
+
+
+def bishop_attacks(index, occupied):
+    """Squares a bishop on `index` attacks, stopping at (and including) the first piece in each direction."""
+    return _slider_attacks(index, occupied, _BISHOP_RAYS)
+
+
+def queen_attacks(index, occupied):
+    return (_slider_attacks(index, occupied, _ROOK_RAYS) |
+            _slider_attacks(index, occupied, _BISHOP_RAYS))
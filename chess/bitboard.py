@@ -0,0 +1,127 @@
+# chess/bitboard.py
+"""
+Bitboard helpers.
+
+A bitboard is a 64-bit integer with one bit per square. Bit ``row * 8 + col``
+is the square at ``board.squares[row][col]``, so bit 0 is a8 (top-left in the
+GUI) and bit 63 is h1.
+"""
+
+from .constant import BOARD_SIZE, WHITE
+
+FULL = (1 << 64) - 1
+
+FILE_A = 0x0101010101010101          # col 0
+FILE_H = FILE_A << 7                 # col 7
+NOT_FILE_A = FULL ^ FILE_A
+NOT_FILE_H = FULL ^ FILE_H
+NOT_FILE_AB = NOT_FILE_A & (FULL ^ (FILE_A << 1))
+NOT_FILE_GH = NOT_FILE_H & (FULL ^ (FILE_A << 6))
+
+RANK_8 = 0xFF                        # row 0
+RANK_1 = RANK_8 << 56                # row 7
+
+
+# ============================================================================
+# SQUARE CONVERSION
+# ============================================================================
+
+def square_index(row, col):
+    """Convert a (row, col) position to a bit index."""
+    return row * BOARD_SIZE + col
+
+
+def square_position(index):
+    """Convert a bit index back to a (row, col) position."""
+    return divmod(index, BOARD_SIZE)
+
+
+def lsb_index(bb):
+    """Index of the least significant set bit (bb must be non-zero)."""
+    return (bb & -bb).bit_length() - 1
+
+
+def iter_indices(bb):
+    """Yield the index of every set bit, lowest first."""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+def to_positions(bb):
+    """List of (row, col) tuples for every set bit."""
+    positions = []
+    while bb:
+        low = bb & -bb
+        positions.append(divmod(low.bit_length() - 1, BOARD_SIZE))
+        bb ^= low
+    return positions
+
+
+def popcount(bb):
+    return bin(bb).count('1')
+
+
+# ============================================================================
+# SET-WISE SHIFTS
+# ============================================================================
+# "North" is towards row 0 (black's back rank), i.e. the direction white
+# pawns move.
+
+def shift_north(bb):
+    return bb >> 8
+
+
+def shift_south(bb):
+    return (bb << 8) & FULL
+
+
+def shift_east(bb):
+    return (bb & NOT_FILE_H) << 1
+
+
+def shift_west(bb):
+    return (bb & NOT_FILE_A) >> 1
+
+
+def shift_north_east(bb):
+    return (bb & NOT_FILE_H) >> 7
+
+
+def shift_north_west(bb):
+    return (bb & NOT_FILE_A) >> 9
+
+
+def shift_south_east(bb):
+    return ((bb & NOT_FILE_H) << 9) & FULL
+
+
+def shift_south_west(bb):
+    return ((bb & NOT_FILE_A) << 7) & FULL
+
+
+# ============================================================================
+# SET-WISE ATTACKS
+# ============================================================================
+
+def knight_attacks(bb):
+    """Squares attacked by every knight in ``bb``."""
+    return (((bb & NOT_FILE_H) >> 15) | ((bb & NOT_FILE_A) >> 17) |
+            ((bb & NOT_FILE_GH) >> 6) | ((bb & NOT_FILE_AB) >> 10) |
+            ((bb & NOT_FILE_A) << 15) | ((bb & NOT_FILE_H) << 17) |
+            ((bb & NOT_FILE_AB) << 6) | ((bb & NOT_FILE_GH) << 10)) & FULL
+
+
+def king_attacks(bb):
+    """Squares attacked by every king in ``bb``."""
+    sideways = shift_east(bb) | shift_west(bb)
+    row = bb | sideways
+    return sideways | shift_north(row) | shift_south(row)
+
+
+def pawn_attacks(bb, color):
+    """Squares attacked diagonally by every ``color`` pawn in ``bb``."""
+    if color == WHITE:
+        return shift_north_east(bb) | shift_north_west(bb)
+    return shift_south_east(bb) | shift_south_west(bb)
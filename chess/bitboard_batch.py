@@ -0,0 +1,160 @@
+# chess/bitboard_batch.py
+"""
+NumPy set-wise bitboard operations: shifts, fills and attack sets.
+
+Every function takes an array of uint64 bitboards (any shape) and works on
+all of them at once, with the same square numbering and file masks as
+bitboard.py: bit ``row * 8 + col``, bit 0 = a8. The slider attacks flood
+every piece in a bitboard at once, where attacks.py looks up one square.
+
+Needs NumPy, which the GUI and the engine don't; only batch tools import
+this module.
+"""
+
+import numpy as np
+
+from . import bitboard
+from .constant import WHITE, BLACK, PIECE_TYPES
+
+U64 = np.uint64
+
+# Layout of stacked per-piece arrays, (N, 12, 64) planes or (N, 12) bitboards:
+# white pawn .. king, then black pawn .. king
+PLANE_ORDER = [(color, name) for color in (WHITE, BLACK) for name in PIECE_TYPES]
+PLANE_INDEX = {key: plane for plane, key in enumerate(PLANE_ORDER)}
+
+FULL = U64(bitboard.FULL)
+FILE_MASKS = [U64(bitboard.FILE_A << col) for col in range(8)]
+ROW_MASKS = [U64(bitboard.RANK_8 << (8 * row)) for row in range(8)]
+NOT_FILE_A = U64(bitboard.NOT_FILE_A)
+NOT_FILE_H = U64(bitboard.NOT_FILE_H)
+NOT_FILE_AB = U64(bitboard.NOT_FILE_AB)
+NOT_FILE_GH = U64(bitboard.NOT_FILE_GH)
+
+_S1, _S6, _S7, _S8, _S9, _S10, _S15, _S17 = (U64(n) for n in (1, 6, 7, 8, 9, 10, 15, 17))
+
+
+def from_planes(planes):
+    """
+    Pack 0/1 square planes (..., 64) into uint64 bitboards (...).
+    Plane index ``row * 8 + col`` becomes that bit.
+    """
+    planes = np.asarray(planes)
+    packed = np.packbits(planes.astype(np.uint8), axis=-1, bitorder='little')
+    return np.ascontiguousarray(packed).view('<u8')[..., 0].astype(U64)
+
+
+def to_planes(bitboards):
+    """Inverse of from_planes: uint64 (...) -> uint8 planes (..., 64)."""
+    as_bytes = np.ascontiguousarray(np.asarray(bitboards, dtype='<u8'))[..., np.newaxis].view(np.uint8)
+    return np.unpackbits(as_bytes, axis=-1, bitorder='little')
+
+
+if hasattr(np, 'bitwise_count'):
+    def popcount(bitboards):
+        return np.bitwise_count(np.asarray(bitboards, dtype=U64)).astype(np.int64)
+else:  # NumPy < 2.0
+    def popcount(bitboards):
+        return to_planes(bitboards).sum(axis=-1, dtype=np.int64)
+
+
+# ============================================================================
+# SHIFTS (see bitboard.py; uint64 shifts drop the bits that fall off)
+# ============================================================================
+
+def shift_north(bb):
+    return bb >> _S8
+
+
+def shift_south(bb):
+    return bb << _S8
+
+
+def shift_east(bb):
+    return (bb & NOT_FILE_H) << _S1
+
+
+def shift_west(bb):
+    return (bb & NOT_FILE_A) >> _S1
+
+
+def shift_north_east(bb):
+    return (bb & NOT_FILE_H) >> _S7
+
+
+def shift_north_west(bb):
+    return (bb & NOT_FILE_A) >> _S9
+
+
+def shift_south_east(bb):
+    return (bb & NOT_FILE_H) << _S9
+
+
+def shift_south_west(bb):
+    return (bb & NOT_FILE_A) << _S7
+
+
+ROOK_SHIFTS = (shift_north, shift_south, shift_east, shift_west)
+BISHOP_SHIFTS = (shift_north_east, shift_north_west, shift_south_east, shift_south_west)
+
+
+# ============================================================================
+# ATTACKS
+# ============================================================================
+
+def knight_attacks(bb):
+    return (((bb & NOT_FILE_H) >> _S15) | ((bb & NOT_FILE_A) >> _S17) |
+            ((bb & NOT_FILE_GH) >> _S6) | ((bb & NOT_FILE_AB) >> _S10) |
+            ((bb & NOT_FILE_A) << _S15) | ((bb & NOT_FILE_H) << _S17) |
+            ((bb & NOT_FILE_AB) << _S6) | ((bb & NOT_FILE_GH) << _S10))
+
+
+def king_attacks(bb):
+    sideways = shift_east(bb) | shift_west(bb)
+    row = bb | sideways
+    return sideways | shift_north(row) | shift_south(row)
+
+
+def pawn_attacks(bb, color):
+    if color == WHITE:
+        return shift_north_east(bb) | shift_north_west(bb)
+    return shift_south_east(bb) | shift_south_west(bb)
+
+
+def fill_north(bb):
+    """Each bit smeared towards row 0 (Kogge-Stone, includes the bit itself)."""
+    bb = bb | (bb >> _S8)
+    bb = bb | (bb >> U64(16))
+    return bb | (bb >> U64(32))
+
+
+def fill_south(bb):
+    """Each bit smeared towards row 7 (includes the bit itself)."""
+    bb = bb | (bb << _S8)
+    bb = bb | (bb << U64(16))
+    return bb | (bb << U64(32))
+
+
+def _slide(bb, shift, empty):
+    attacks = np.zeros_like(bb)
+    ray = shift(bb)
+    while ray.any():
+        attacks |= ray
+        ray = shift(ray & empty)
+    return attacks
+
+
+def rook_attacks(bb, occupied):
+    empty = ~occupied
+    attacks = np.zeros_like(bb)
+    for shift in ROOK_SHIFTS:
+        attacks |= _slide(bb, shift, empty)
+    return attacks
+
+
+def bishop_attacks(bb, occupied):
+    empty = ~occupied
+    attacks = np.zeros_like(bb)
+    for shift in BISHOP_SHIFTS:
+        attacks |= _slide(bb, shift, empty)
+    return attacks
@@ -32,11 +32,19 @@ KNIGHT = 'knight'
 BISHOP = 'bishop'
 QUEEN = 'queen'
 KING = 'king'
+PIECE_TYPES = (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING)
 
 # Piece colors
 PIECE_WHITE = 'white'
 PIECE_BLACK = 'black'
 
+# Castling rights (bit flags)
+CASTLE_WHITE_KING = 1
+CASTLE_WHITE_QUEEN = 2
+CASTLE_BLACK_KING = 4
+CASTLE_BLACK_QUEEN = 8
+CASTLE_ALL = 15
+
 # Game states
 STATE_WHITE_TURN = 'white_turn'
 STATE_BLACK_TURN = 'black_turn'
@@ -0,0 +1,505 @@
+import time
+import pygame
+from chess.board import Board
+from chess.renderer import BoardRenderer
+from chess.constant import WINDOW_WIDTH, WINDOW_HEIGHT
+from chess.ai.minmax.MinimaxNode import MinimaxNode
+from chess.ai.worker import SearchWorker
+class ChessGameManager:
+    """
+    Manages different game modes and AI integration
+    Compatible with existing Board class and Node system
+    """
+    
+    def __init__(self, game_mode='human_vs_human', ai_color='black', ai_depth=3, workers=1,
+                 parallel='smp', tt_size_mb=16, ai_time_limit_ms=None, ponder=False):
+        pygame.init()
+        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption(f"Chess - {game_mode.replace('_', ' ').title()}")
+        self.clock = pygame.time.Clock()
+        self.renderer = BoardRenderer()
+        
+        # Game state
+        self.board = Board()
+        self.game_mode = game_mode
+        self.ai_color = ai_color
+        self.ai_depth = ai_depth
+        self.workers = workers  # search processes; more than 1 searches in parallel
+        self.parallel = parallel  # 'smp' (Lazy SMP) or 'root' (root moves split over a pool)
+        self.ai_time_limit_ms = ai_time_limit_ms  # per-move budget; None = depth only
+        self.ponder = ponder  # think on the human's time in human_vs_ai
+        self.tt_size_mb = tt_size_mb
+        self.running = True
+        self.game_over = False
+        self.winner = None  # 'White', 'Black' or 'Draw' once the game is over
+        
+        # Node system (your existing functionality)
+        self.current_node = None
+        self.move_history = []
+        
+        # AI system (extensible for multiple AIs)
+        self.ai_players = {}
+        self._initialize_ai_system()
+        
+        # Initialize nodes
+        self._initialize_root_node()
+        
+        # Game mode specific
+        self._setup_game_mode()
+    
+    def _initialize_ai_system(self):
+        """Initialize AI players - extensible for multiple AI types"""
+        # Placeholder for future AI implementations
+        self.ai_players = {
+            'minimax': None,  # Will be initialized when needed
+            'neural_net': None,
+            'random': None
+        }
+        # The engine runs in a background process and is kept for the whole
+        # game, so its transposition table stays valid across moves. The main
+        # loop polls pending_search once per frame.
+        self.search_worker = SearchWorker(self.workers, self.parallel, self.tt_size_mb)
+        self.ai_players['minimax'] = self.search_worker
+        self.pending_search = None
+        # Pondering: search running on the human's time, the reply it assumes,
+        # and when a correct guess was confirmed
+        self.ponder_search = None
+        self.ponder_move = None
+        self.ponder_hit_at = None
+        # Last search the AI played from; its PV is the line it expects
+        self.last_search_result = None
+        print(f"🤖 AI System Ready - Modes: {list(self.ai_players.keys())}")
+        tables = f"{self.workers} x {self.tt_size_mb}" if self.parallel == 'root' and self.workers > 1 else self.tt_size_mb
+        print(f"🗄️ Transposition table: {tables} MB")
+        if self.workers > 1:
+            mode = 'Root split' if self.parallel == 'root' else 'Lazy SMP'
+            print(f"🧵 {mode}: {self.workers} search processes")
+    
+    def _initialize_root_node(self):
+        """Your existing node initialization"""
+        print("🎯 INITIALIZING ROOT NODE...")
+        self.current_node = MinimaxNode(
+            board=self.board,
+            move=None,
+            depth=0,
+            is_maximizing=True
+        )
+        self.current_node.evaluate_position()
+        self.move_history.append(self.current_node)
+        print(f"✅ Root node created: {self.current_node}")
+    
+    def _setup_game_mode(self):
+        """Configure the selected game mode"""
+        mode_descriptions = {
+            'human_vs_human': "Human vs Human",
+            'human_vs_ai': f"Human vs AI ({self.ai_color})", 
+            'ai_vs_ai': "AI vs AI",
+            'analysis': "Position Analysis Mode"
+        }
+        
+        print(f"🎮 Game Mode: {mode_descriptions.get(self.game_mode, self.game_mode)}")
+        
+        if self.game_mode == 'human_vs_ai':
+            print(f"🤖 AI playing as: {self.ai_color}")
+        elif self.game_mode == 'ai_vs_ai':
+            print("🤖 AI vs AI match started!")
+    
+    # ============================================================================
+    # GAME MODE MANAGEMENT
+    # ============================================================================
+    
+    def set_game_mode(self, new_mode, ai_color=None):
+        """Change game mode dynamically"""
+        self._cancel_ai_search()
+        self.game_mode = new_mode
+        if ai_color:
+            self.ai_color = ai_color
+        self._setup_game_mode()
+        print(f"🔄 Game mode changed to: {new_mode}")
+    
+    def is_ai_turn(self):
+        """Check if it's currently AI's turn to move"""
+        if self.game_mode == 'human_vs_human':
+            return False
+        elif self.game_mode == 'human_vs_ai':
+            return self.board.current_player == self.ai_color
+        elif self.game_mode == 'ai_vs_ai':
+            return True  # Always AI's turn in AI vs AI
+        return False
+    
+    def get_current_player_type(self):
+        """Get type of current player (human/ai)"""
+        if self.game_mode == 'human_vs_human':
+            return 'human'
+        elif self.game_mode == 'human_vs_ai':
+            return 'ai' if self.board.current_player == self.ai_color else 'human'
+        elif self.game_mode == 'ai_vs_ai':
+            return 'ai'
+        return 'human'
+    
+    # ============================================================================
+    # MOVE HANDLING (Compatible with your existing system)
+    # ============================================================================
+    
+    def handle_human_move(self, pos):
+        """Handle human move - compatible with your existing Board.handle_click"""
+        result = self.board.handle_click(pos)
+        if result:
+            action, piece = result
+            print(f"\n🖱️ {action}: {piece.color} {piece.name}")
+            
+            if action == 'move_executed':
+                self._resolve_ponder(self.board.move_stack[-1].move)
+                self._create_move_node()
+                return True
+        return False
+    
+    def handle_ai_move(self):
+        """Search the current position and play the engine's best move"""
+        if not self.is_ai_turn() or self.game_over:
+            return False
+        
+        print(f"🤖 AI ({self.board.current_player}) thinking...")
+        request = self.search_worker.submit(self.board, depth=self.ai_depth,
+                                            time_limit_ms=self.ai_time_limit_ms)
+        request.wait()
+        if request.error:
+            raise request.error
+        return self._play_search_result(request.result)
+    
+    def _poll_ai_move(self):
+        """
+        Non-blocking AI turn for the main loop: start a background search the
+        first time, then play its move on the frame it finishes.
+        """
+        if self.pending_search is None:
+            print(f"🤖 AI ({self.board.current_player}) thinking...")
+            self.pending_search = self.search_worker.submit(
+                self.board, depth=self.ai_depth, time_limit_ms=self.ai_time_limit_ms)
+            return False
+        
+        if not self.pending_search.done():
+            if self.ponder_hit_at is not None:
+                self._finish_ponder_hit()
+            return False
+        
+        request, self.pending_search = self.pending_search, None
+        self.ponder_hit_at = None
+        if request.error:
+            raise request.error
+        # Ignore stale results (cancelled, or the position changed meanwhile)
+        if request.cancelled or request.position_key != self.board.zobrist_key:
+            return False
+        return self._play_search_result(request.result)
+    
+    def _cancel_ai_search(self):
+        """Abort the background search, if one is running"""
+        if self.pending_search is not None:
+            self.pending_search.cancel()
+            self.pending_search = None
+            self.ponder_hit_at = None
+            print("🛑 AI search cancelled")
+        if self.ponder_search is not None:
+            self.ponder_search.cancel()
+            self.ponder_search = None
+            self.ponder_move = None
+    
+    # ============================================================================
+    # PONDERING
+    # ============================================================================
+    
+    def _start_ponder(self, result):
+        """After an AI move, search the position after the reply the PV expects"""
+        if not self.ponder or self.game_mode != 'human_vs_ai' or self.game_over:
+            return
+        if len(result.pv) < 2:
+            return
+        self.ponder_move = result.pv[1]
+        self.ponder_search = self.search_worker.ponder(self.board, self.ponder_move)
+        print(f"💭 Pondering on expected reply {self.ponder_move.uci()}")
+    
+    def _resolve_ponder(self, played_move):
+        """
+        On a human move: if it is the reply we pondered on, the running search
+        becomes the AI's search for this turn; otherwise throw it away.
+        The transposition table stays warm either way.
+        """
+        if self.ponder_search is None:
+            return
+        request, self.ponder_search = self.ponder_search, None
+        if played_move == self.ponder_move:
+            print(f"🎯 Ponder hit on {played_move.uci()}")
+            self.pending_search = request
+            self.ponder_hit_at = time.perf_counter()
+        else:
+            print(f"❌ Ponder miss ({played_move.uci()} instead of {self.ponder_move.uci()})")
+            request.cancel()
+        self.ponder_move = None
+    
+    def _finish_ponder_hit(self):
+        """Stop a confirmed ponder search once it satisfies this turn's depth or time budget"""
+        latest = self.pending_search.latest
+        if latest is None:
+            return
+        elapsed_ms = (time.perf_counter() - self.ponder_hit_at) * 1000
+        out_of_time = self.ai_time_limit_ms is not None and elapsed_ms >= self.ai_time_limit_ms
+        if latest.depth >= self.ai_depth or out_of_time:
+            self.pending_search.stop()
+    
+    def _play_search_result(self, result):
+        """Play the best move from a SearchResult on the game board"""
+        if result.best_move is None:
+            # No legal moves: _check_game_end reports checkmate or stalemate
+            self._check_game_end()
+            return False
+        
+        move = result.best_move
+        from_square = self.board.squares[move.from_pos[0]][move.from_pos[1]]
+        to_square = self.board.squares[move.to_pos[0]][move.to_pos[1]]
+        captured_piece = self.board.make_move(move)
+        self.board.clear_cache()
+        
+        self.last_search_result = result
+        print(f"🤖 AI moved: {move.uci()} | Score: {result.score} | Depth: {result.depth} | "
+              f"Nodes: {result.nodes} | {result.nps:.0f} nps")
+        self._create_move_node((from_square, to_square), captured_piece)
+        self._start_ponder(result)
+        return True
+    
+    def _create_move_node(self, move=None, captured_piece=None):
+        """Create node for the current position - your existing functionality"""
+        new_node = MinimaxNode(
+            board=self.board,
+            move=move,
+            parent=self.current_node,
+            depth=len(self.move_history),
+            is_maximizing=(self.board.current_player == 'white')
+        )
+        new_node.evaluate_position()
+        
+        self.current_node = new_node
+        self.move_history.append(new_node)
+        
+        self._print_move_analysis(new_node, captured_piece)
+        
+        # Check game end
+        self._check_game_end()
+
+
+    # ============================================================================
+    # YOUR EXISTING NODE DEBUGGING FUNCTIONALITY
+    # ============================================================================
+    
+    def _print_move_analysis(self, node, captured_piece):
+        """Your existing move analysis"""
+        print("\n" + "="*60)
+        print(f"🎯 MOVE {len(self.move_history)}: {node.move_notation}")
+        print("="*60)
+        print(f"Move: {node.move_notation}")
+        print(f"Player: {node.player}")
+        print(f"Depth: {node.depth}")
+        
+        if captured_piece:
+            print(f"Capture: {captured_piece.color} {captured_piece.name}")
+        
+        print("\n📊 POSITION EVALUATION:")
+        print(f"Total Value: {node.value}")
+        print(f"Material: {node.raw_material}")
+        print(f"Positional: {node.positional_score}")
+        
+        line = self._expected_line()
+        if line:
+            result = self.last_search_result
+            print(f"\n🧠 EXPECTED LINE (score {result.score}, depth {result.depth}):")
+            print(f"  {line}")
+        
+        print("\n🔍 EVALUATION BREAKDOWN:")
+        for category, score in node.evaluation_breakdown.items():
+            if score != 0:
+                print(f"  {category:15}: {score:>6}")
+        
+        print(f"\n⚡ GAME STATE:")
+        print(f"Check: {node.is_check}")
+        print(f"Current player: {self.board.current_player}")
+        print(f"Player type: {self.get_current_player_type()}")
+        print("="*60)
+    
+    def _expected_line(self, max_moves=None):
+        """The AI's principal variation, if the last move played was its best move"""
+        result = self.last_search_result
+        if result is None or not result.pv or not self.board.move_stack:
+            return None
+        if self.board.move_stack[-1].move != result.pv[0]:
+            return None
+        pv = result.pv if max_moves is None else result.pv[:max_moves]
+        return ' '.join(move.uci() for move in pv)
+    
+    def print_current_game_state(self):
+        """Your existing game state printing"""
+        print("\n" + "="*50)
+        print("📈 CURRENT GAME STATE SUMMARY")
+        print("="*50)
+        print(f"Total moves: {len(self.move_history)}")
+        print(f"Current player: {self.board.current_player} ({self.get_current_player_type()})")
+        print(f"Game mode: {self.game_mode}")
+        print(f"Current node: {self.current_node}")
+        
+        print("\n📜 LAST 3 MOVES:")
+        for i, node in enumerate(self.move_history[-3:]):
+            player_type = 'AI' if (i % 2 == 0 and self.ai_color == 'white') or (i % 2 == 1 and self.ai_color == 'black') else 'Human'
+            print(f"  Move {node.depth}: {node.move_notation} (Value: {node.value}) - {player_type}")
+        
+        print("="*50)
+    
+    def _print_move_history(self):
+        """Your existing move history"""
+        print("\n" + "="*60)
+        print("📜 COMPLETE MOVE HISTORY")
+        print("="*60)
+        for i, node in enumerate(self.move_history):
+            marker = " →" if node == self.current_node else "  "
+            player_type = 'AI' if (i % 2 == 0 and self.ai_color == 'white') or (i % 2 == 1 and self.ai_color == 'black') else 'Human'
+            print(f"{marker} Move {i}: {node.move_notation:8} | Value: {node.value:6} | Player: {node.player} | Type: {player_type}")
+        print("="*60)
+    
+    # ============================================================================
+    # GAME FLOW MANAGEMENT
+    # ============================================================================
+    
+    def _check_game_end(self):
+        """
+        End the game if the side to move has no legal moves: checkmate when
+        it's in check, stalemate otherwise. A plain check doesn't end it.
+        """
+        if self.board.generate_legal_moves():
+            return False
+        color = self.board.current_player
+        self.game_over = True
+        if self.board.is_in_check(color):
+            self.winner = "Black" if color == 'white' else "White"
+            print(f"\n🏆 GAME OVER! Checkmate - Winner: {self.winner}")
+        else:
+            self.winner = "Draw"
+            print("\n🤝 GAME OVER! Draw by stalemate")
+        return True
+    
+    def reset_game(self, new_mode=None, new_ai_color=None):
+        """Reset game with optional new settings"""
+        print("\n🔄 RESETTING GAME...")
+        self._cancel_ai_search()
+        self.last_search_result = None
+        self.board = Board()
+        self.move_history = []
+        self.game_over = False
+        self.winner = None
+        
+        if new_mode:
+            self.game_mode = new_mode
+        if new_ai_color:
+            self.ai_color = new_ai_color
+        
+        self._initialize_root_node()
+        self._setup_game_mode()
+        print("✅ Game reset complete!")
+    
+    # ============================================================================
+    # MAIN GAME LOOP
+    # ============================================================================
+    
+    def run(self):
+        """Main game loop with AI integration"""
+        while self.running:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    if event.button == 1 and not self.game_over:
+                        if self.get_current_player_type() == 'human':
+                            self.handle_human_move(event.pos)
+                
+                # Your existing debug controls
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_d:  # Debug info
+                        self.print_current_game_state()
+                    elif event.key == pygame.K_n:  # Node details
+                        print("\n" + "="*60)
+                        print("🔍 CURRENT NODE DETAILS:")
+                        print("="*60)
+                        # print(self.current_node.detailed_repr())
+                    elif event.key == pygame.K_h:  # Move history
+                        self._print_move_history()
+                    elif event.key == pygame.K_r:  # Reset
+                        self.reset_game()
+                    elif event.key == pygame.K_1:  # Switch to Human vs Human
+                        self.reset_game('human_vs_human')
+                    elif event.key == pygame.K_2:  # Switch to Human vs AI (White)
+                        self.reset_game('human_vs_ai', 'black')
+                    elif event.key == pygame.K_3:  # Switch to Human vs AI (Black)  
+                        self.reset_game('human_vs_ai', 'white')
+                    elif event.key == pygame.K_4:  # Switch to AI vs AI
+                        self.reset_game('ai_vs_ai')
+            
+            # AI move handling (searches in the background, never blocks)
+            if not self.game_over and self.is_ai_turn():
+                self._poll_ai_move()
+            
+            # Drawing
+            self._draw_game()
+            pygame.display.flip()
+            self.clock.tick(60)
+        
+        self._cancel_ai_search()
+        self.search_worker.shutdown(wait=True)
+        pygame.quit()
+    
+    def _draw_game(self):
+        """Draw game with enhanced UI"""
+        self.renderer.draw(self.screen, self.board)
+        self._draw_ui_overlay()
+    
+    def _draw_ui_overlay(self):
+        """Draw game information overlay"""
+        font = pygame.font.Font(None, 24)
+        
+        # Game info
+        game_info = [
+            f"Mode: {self.game_mode}",
+            f"Move: {len(self.move_history)}",
+            f"Player: {self.board.current_player} ({self.get_current_player_type()})",
+            f"Eval: {self.current_node.value if self.current_node else 'N/A'}"
+        ]
+        
+        line = self._expected_line(max_moves=6)
+        if line:
+            game_info.append(f"Line: {line}")
+        
+        if self.pending_search is not None:
+            dots = '.' * (pygame.time.get_ticks() // 400 % 4)
+            game_info.append(f"AI thinking{dots}")
+        
+        for i, info in enumerate(game_info):
+            text_surface = font.render(info, True, (255, 255, 255))
+            self.screen.blit(text_surface, (10, 10 + i * 25))
+        
+        # Controls
+        controls = [
+            "D: Debug | N: Node | H: History | R: Reset",
+            "1: HvH | 2: HvAI(Black) | 3: HvAI(White) | 4: AIvAI"
+        ]
+        
+        for i, control in enumerate(controls):
+            text_surface = font.render(control, True, (200, 200, 200))
+            self.screen.blit(text_surface, (10, WINDOW_HEIGHT - 60 + i * 25))
+        
+        # Game over message
+        if self.game_over and self.winner:
+            overlay = pygame.Surface((WINDOW_WIDTH, 60), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))
+            self.screen.blit(overlay, (0, WINDOW_HEIGHT // 2 - 30))
+            
+            font_large = pygame.font.Font(None, 48)
+            message = "GAME OVER - DRAW" if self.winner == "Draw" else f"GAME OVER - {self.winner} WINS!"
+            text = font_large.render(message, True, (255, 255, 0))
+            text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+            self.screen.blit(text, text_rect)
\ No newline at end of file
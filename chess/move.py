@@ -0,0 +1,72 @@
+# chess/move.py
+"""
+Move and undo-record value types used by Board.make_move / Board.unmake_move.
+"""
+
+FILES = 'abcdefgh'
+PROMOTION_LETTERS = {'queen': 'q', 'rook': 'r', 'bishop': 'b', 'knight': 'n'}
+
+
+def position_to_algebraic(position):
+    """(row, col) -> 'e4'. Row 0 is the 8th rank."""
+    row, col = position
+    return f"{FILES[col]}{8 - row}"
+
+
+def algebraic_to_position(name):
+    """'e4' -> (row, col)."""
+    return 8 - int(name[1]), FILES.index(name[0])
+
+
+class Move:
+    """
+    A single move from one square to another.
+
+    Positions are (row, col) tuples like everywhere else on the Board.
+    `promotion` is a piece name ('queen', 'rook', ...) or None.
+    """
+    __slots__ = ('from_pos', 'to_pos', 'promotion', 'is_castle', 'is_en_passant')
+
+    def __init__(self, from_pos, to_pos, promotion=None, is_castle=False, is_en_passant=False):
+        self.from_pos = from_pos
+        self.to_pos = to_pos
+        self.promotion = promotion
+        self.is_castle = is_castle
+        self.is_en_passant = is_en_passant
+
+    def uci(self):
+        """Long algebraic notation, e.g. 'e2e4' or 'e7e8q'."""
+        text = position_to_algebraic(self.from_pos) + position_to_algebraic(self.to_pos)
+        if self.promotion:
+            text += PROMOTION_LETTERS[self.promotion]
+        return text
+
+    def __eq__(self, other):
+        return (isinstance(other, Move) and self.from_pos == other.from_pos and
+                self.to_pos == other.to_pos and self.promotion == other.promotion)
+
+    def __hash__(self):
+        return hash((self.from_pos, self.to_pos, self.promotion))
+
+    def __repr__(self):
+        return f'Move({self.uci()})'
+
+
+class UndoRecord:
+    """Everything Board.unmake_move needs to put the previous position back."""
+    __slots__ = ('move', 'piece', 'captured', 'captured_pos', 'had_moved', 'rook_had_moved',
+                 'castling_rights', 'en_passant_square', 'halfmove_clock', 'last_move', 'zobrist_key')
+
+    def __init__(self, move, piece, had_moved, castling_rights, en_passant_square,
+                 halfmove_clock, last_move, zobrist_key):
+        self.move = move
+        self.piece = piece
+        self.captured = None
+        self.captured_pos = None
+        self.had_moved = had_moved
+        self.rook_had_moved = False
+        self.castling_rights = castling_rights
+        self.en_passant_square = en_passant_square
+        self.halfmove_clock = halfmove_clock
+        self.last_move = last_move
+        self.zobrist_key = zobrist_key
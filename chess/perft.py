@@ -0,0 +1,117 @@
+# chess/perft.py
+"""
+Perft: count the leaf nodes of the legal move tree to a fixed depth.
+
+The counts are known exactly for standard positions, so perft is both the
+correctness check for move generation (castling, en passant, promotions,
+pins) and its throughput benchmark:
+
+    python -m chess.perft 4
+    python -m chess.perft 3 --fen "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1" --divide
+    python -m chess.perft 5 --processes 8
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .board import Board, STARTING_FEN
+
+
+def perft(board, depth):
+    """
+    Number of leaf nodes `depth` plies below the current position.
+
+    The last ply is bulk-counted with Board.count_legal_moves(), which
+    finds the legal moves from check and pin masks, so at that ply no move
+    is generated or made (generate_legal_moves tests each one by making it).
+    """
+    if depth <= 0:
+        return 1
+    if depth == 1:
+        return board.count_legal_moves()
+    nodes = 0
+    for move in board.generate_legal_moves():
+        board.make_move(move)
+        nodes += perft(board, depth - 1)
+        board.unmake_move()
+    return nodes
+
+
+def divide(board, depth):
+    """
+    Perft split by root move.
+
+    Returns:
+        Dict of UCI move -> leaf count below it (in generation order)
+    """
+    counts = {}
+    for move in board.generate_legal_moves():
+        board.make_move(move)
+        counts[move.uci()] = perft(board, depth - 1)
+        board.unmake_move()
+    return counts
+
+
+def _perft_root_move(fen, uci, depth):
+    """Process pool task: perft below one root move."""
+    board = Board.from_fen(fen)
+    board.make_move(board.parse_uci(uci))
+    return uci, perft(board, depth - 1)
+
+
+def parallel_divide(board, depth, processes):
+    """divide(), with the root moves spread over a pool of `processes`."""
+    fen = board.to_fen()
+    moves = [move.uci() for move in board.generate_legal_moves()]
+    counts = {}
+    with ProcessPoolExecutor(processes) as pool:
+        futures = [pool.submit(_perft_root_move, fen, uci, depth) for uci in moves]
+        for future in futures:
+            uci, nodes = future.result()
+            counts[uci] = nodes
+    return counts
+
+
+def run(fen=STARTING_FEN, depth=4, show_divide=False, processes=1):
+    """
+    Run perft and print the result with timing.
+
+    Returns:
+        Total node count
+    """
+    board = Board.from_fen(fen)
+    start = time.perf_counter()
+    if processes > 1 and depth > 1:
+        counts = parallel_divide(board, depth, processes)
+        nodes = sum(counts.values())
+    elif show_divide and depth > 0:
+        counts = divide(board, depth)
+        nodes = sum(counts.values())
+    else:
+        counts = None
+        nodes = perft(board, depth)
+    elapsed = time.perf_counter() - start
+
+    if show_divide and counts is not None:
+        for uci, count in counts.items():
+            print(f"{uci}: {count}")
+        print()
+    nps = nodes / elapsed if elapsed > 0 else 0.0
+    print(f"🔢 Perft({depth}) = {nodes} | {elapsed:.2f}s | {nps:.0f} nps")
+    return nodes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Count legal move tree leaves (perft)")
+    parser.add_argument('depth', type=int, help="plies to search")
+    parser.add_argument('--fen', default=STARTING_FEN, help="position (default: starting position)")
+    parser.add_argument('--divide', action='store_true', help="print the count below each root move")
+    parser.add_argument('--processes', type=int, default=1, metavar='N',
+                        help="spread root moves over N processes")
+    args = parser.parse_args(argv)
+    run(args.fen, args.depth, args.divide, args.processes)
+
+
+if __name__ == '__main__':
+    main()
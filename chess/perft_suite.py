@@ -0,0 +1,132 @@
+# chess/perft_suite.py
+"""
+Perft regression suite: well-known positions with their exact node counts
+at depths 1-5.
+
+Run it after touching move generation (the pieces' get_valid_moves,
+Board's castling / en passant / promotion handling) to catch both wrong
+counts and speed regressions:
+
+    python -m chess.perft_suite                 # depths 1-3, a few seconds
+    python -m chess.perft_suite --max-depth 4   # slower, more thorough
+    python -m chess.perft_suite --only kiwipete --max-depth 5
+
+Exits with status 1 if any count differs from the reference.
+"""
+
+import argparse
+import sys
+import time
+
+from .board import Board
+from .perft import perft
+
+# name -> (FEN, counts at depth 1..5)
+PERFT_POSITIONS = {
+    'start': ('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1',
+              (20, 400, 8902, 197281, 4865609)),
+    'kiwipete': ('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+                 (48, 2039, 97862, 4085603, 193690690)),
+    'position 3': ('8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+                   (14, 191, 2812, 43238, 674624)),
+    'position 4': ('r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+                   (6, 264, 9467, 422333, 15833292)),
+    'position 5': ('rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+                   (44, 1486, 62379, 2103487, 89941194)),
+    'position 6': ('r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+                   (46, 2079, 89890, 3894594, 164075551)),
+
+    # En passant
+    'ep pinned pawn': ('8/8/1k6/2b5/2pP4/8/5K2/8 b - d3 0 1',
+                       (15, 126, 1928, 13931, 206379)),
+    'ep discovered check': ('3k4/3p4/8/K1P4r/8/8/8/8 b - - 0 1',
+                            (18, 92, 1670, 10138, 185429)),
+    'ep horizontal pin': ('8/8/8/8/k2Pp2Q/8/8/3K4 b - d3 0 1',
+                          (6, 136, 863, 20471, 117741)),
+    'ep gives check': ('8/8/4k3/8/2p5/8/B2P2K1/8 w - - 0 1',
+                       (13, 102, 1266, 10276, 135655)),
+
+    # Castling
+    'white short castle': ('4k3/8/8/8/8/8/8/4K2R w K - 0 1',
+                           (15, 66, 1197, 7059, 133987)),
+    'white long castle': ('4k3/8/8/8/8/8/8/R3K3 w Q - 0 1',
+                          (16, 71, 1287, 7626, 145232)),
+    'black short castle': ('4k2r/8/8/8/8/8/8/4K3 w k - 0 1',
+                           (5, 75, 459, 8290, 47635)),
+    'all castles': ('r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1',
+                    (26, 568, 13744, 314346, 7594526)),
+    'castle into check': ('r3k2r/8/3Q4/8/8/5q2/8/R3K2R b KQkq - 0 1',
+                          (44, 1494, 50509, 1720476, 58773923)),
+    'castling gives check': ('5k2/8/8/8/8/8/8/4K2R w K - 0 1',
+                             (15, 66, 1198, 6399, 120330)),
+    'long castling gives check': ('3k4/8/8/8/8/8/8/R3K3 w Q - 0 1',
+                                  (16, 71, 1286, 7418, 141077)),
+    'castle rights lost': ('r3k2r/1b4bq/8/8/8/8/7B/R3K2R w KQkq - 0 1',
+                           (26, 1141, 27826, 1274206, 31912360)),
+
+    # Promotion
+    'promotions': ('n1n5/PPPk4/8/8/8/8/4Kppp/5N1N b - - 0 1',
+                   (24, 496, 9483, 182838, 3605103)),
+    'underpromote to check': ('8/P1k5/K7/8/8/8/8/8 w - - 0 1',
+                              (6, 27, 273, 1329, 18135)),
+    'promote out of check': ('2K2r2/4P3/8/8/8/8/8/3k4 w - - 0 1',
+                             (11, 133, 1442, 19174, 266199)),
+}
+
+
+def run_suite(max_depth=3, only=None, verbose=True):
+    """
+    Perft every position (or those whose name contains `only`) at depths
+    1..max_depth and compare with the reference counts.
+
+    Returns:
+        List of dicts: position, depth, expected, nodes, seconds, ok
+    """
+    rows = []
+    for name, (fen, expected_counts) in PERFT_POSITIONS.items():
+        if only and only.lower() not in name:
+            continue
+        board = Board.from_fen(fen)
+        for depth, expected in enumerate(expected_counts[:max_depth], start=1):
+            start = time.perf_counter()
+            nodes = perft(board, depth)
+            seconds = time.perf_counter() - start
+            row = {'position': name, 'depth': depth, 'expected': expected, 'nodes': nodes,
+                   'seconds': seconds, 'ok': nodes == expected}
+            rows.append(row)
+            if verbose:
+                status = '✅' if row['ok'] else f'❌ expected {expected}'
+                nps = nodes / seconds if seconds > 0 else 0.0
+                print(f"{name:<28} depth {depth}  {nodes:>10} {seconds:>8.2f}s {nps:>9.0f} nps  {status}")
+    return rows
+
+
+def print_summary(rows):
+    nodes = sum(row['nodes'] for row in rows)
+    seconds = sum(row['seconds'] for row in rows)
+    failures = [row for row in rows if not row['ok']]
+    nps = nodes / seconds if seconds > 0 else 0.0
+    print()
+    print(f"📊 {len(rows)} counts, {nodes} nodes in {seconds:.2f}s | {nps:.0f} nps")
+    if failures:
+        print(f"❌ {len(failures)} mismatches:")
+        for row in failures:
+            print(f"  {row['position']} depth {row['depth']}: {row['nodes']} != {row['expected']}")
+    else:
+        print("✅ All counts match")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perft regression suite")
+    parser.add_argument('--max-depth', type=int, default=3, choices=range(1, 6),
+                        help="deepest depth to check (1-5, default 3)")
+    parser.add_argument('--only', help="run positions whose name contains this text")
+    args = parser.parse_args(argv)
+    rows = run_suite(args.max_depth, args.only)
+    print_summary(rows)
+    if any(not row['ok'] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,32 +1,17 @@
 from .piece import Piece
+from ..attacks import bishop_attacks
 
 class Bishop(Piece):
+    __slots__ = ()
+
     def __init__(self, color, name='bishop', value=3):
         super().__init__(color, name, value)
     
     def get_valid_moves(self, board, position):
         row, col = position
-        moves = []
-        capture_moves = []
-        
-        # Four diagonal directions
-        directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
-        
-        for direction in directions:
-            for distance in range(1, 8):
-                new_row = row + direction[0] * distance
-                new_col = col + direction[1] * distance
-                
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-                
-                target_square = board.get_square(new_row, new_col)
-                
-                if target_square.is_empty():
-                    moves.append((new_row, new_col))
-                else:
-                    if target_square.piece.color != self.color:
-                        capture_moves.append((new_row, new_col))
-                    break  # Stop in this direction after hitting any piece
-        
-        return moves, capture_moves
\ No newline at end of file
+        # Four diagonal directions, each stopping at the first piece it hits
+        targets = self.attacks(board, row * 8 + col)
+        return self._split_targets(board, targets)
+
+    def attacks(self, board, index):
+        return bishop_attacks(index, board.occupied)
\ No newline at end of file
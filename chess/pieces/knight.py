@@ -1,6 +1,9 @@
 from .piece import Piece
+from ..attacks import KNIGHT_ATTACKS
 
 class Knight(Piece):
+    __slots__ = ()
+
     def __init__(self, color, name='knight', value=3):
         super().__init__(color, name, value)
     
@@ -12,33 +15,10 @@ class Knight(Piece):
         - capture_moves: squares with opponent pieces that can be captured
         """
         row, col = position
-        moves = []
-        capture_moves = []
-        
-        # All possible knight moves (8 possible L-shapes)
-        knight_moves = [
-            (-2, -1), (-2, 1),  # Up 2, left/right 1
-            (-1, -2), (-1, 2),  # Up 1, left/right 2
-            (1, -2), (1, 2),    # Down 1, left/right 2
-            (2, -1), (2, 1)     # Down 2, left/right 1
-        ]
-        
-        for move in knight_moves:
-            new_row = row + move[0]
-            new_col = col + move[1]
-            
-            # Check if move is within board bounds
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target_square = board.get_square(new_row, new_col)
-                
-                if target_square.is_empty():
-                    # Empty square - regular move
-                    moves.append((new_row, new_col))
-                elif target_square.piece.color != self.color:
-                    # Opponent piece - capture move
-                    capture_moves.append((new_row, new_col))
-    
-        return moves, capture_moves
+        return self._split_targets(board, self.attacks(board, row * 8 + col))
+
+    def attacks(self, board, index):
+        return KNIGHT_ATTACKS[index]
     
     def __str__(self):
         return f"{self.color[0].upper()}N"  # WN or BN
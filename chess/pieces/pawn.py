@@ -1,39 +1,46 @@
 from .piece import Piece
+from ..bitboard import FULL, RANK_1, RANK_8, shift_north, shift_south, to_positions
+from ..attacks import PAWN_ATTACKS
 
 class Pawn(Piece):
+    __slots__ = ()
+
     def __init__(self, color, name='pawn', value=1):
         super().__init__(color, name, value)
-        self.has_moved = False
     
     def get_valid_moves(self, board, position):
         row, col = position
-        moves = []
-        capture_moves = []
-        
-        direction = -1 if self.color == 'white' else 1
+        index = row * 8 + col
+        bit = 1 << index
+        empty = FULL ^ board.occupied
+        forward = shift_north if self.color == 'white' else shift_south
         
         # Single forward move
-        new_row = row + direction
-        if 0 <= new_row < 8:
-            forward_square = board.get_square(new_row, col)
-            if forward_square.is_empty():
-                moves.append((new_row, col))
-                
-                # Double forward move
-                if not self.has_moved:
-                    double_row = row + (2 * direction)
-                    if 0 <= double_row < 8:
-                        double_square = board.get_square(double_row, col)
-                        if double_square.is_empty():
-                            moves.append((double_row, col))
+        targets = forward(bit) & empty
+        
+        # Double forward move
+        if targets and not self.has_moved:
+            targets |= forward(targets) & empty
         
         # Diagonal captures
-        for capture_col in [col - 1, col + 1]:
-            if 0 <= capture_col < 8 and 0 <= new_row < 8:
-                capture_square = board.get_square(new_row, capture_col)
-                if (not capture_square.is_empty() and 
-                    capture_square.piece.color != self.color):
-                    capture_moves.append((new_row, capture_col))
+        enemy = board.occupied ^ board.occupancy[self.color]
+        captures = PAWN_ATTACKS[self.color][index] & enemy
+        
+        return to_positions(targets), to_positions(captures)
+
+    def attacks(self, board, index):
+        return PAWN_ATTACKS[self.color][index]
+
+    def get_capture_moves(self, board, position):
+        """Diagonal captures plus forward pushes that promote."""
+        row, col = position
+        index = row * 8 + col
+        enemy = board.occupied ^ board.occupancy[self.color]
+        targets = PAWN_ATTACKS[self.color][index] & enemy
         
-        return moves, capture_moves
+        if self.color == 'white':
+            targets |= shift_north(1 << index) & ~board.occupied & RANK_8
+        else:
+            targets |= shift_south(1 << index) & ~board.occupied & RANK_1
+        return to_positions(targets)
     
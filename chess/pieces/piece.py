@@ -1,15 +1,19 @@
-import os.path as path
-from pygame import image
+from abc import ABC, abstractmethod
 
-class Piece:
+from ..bitboard import to_positions
+
+class Piece(ABC):
 
     '''Please enter a Doc String...'''
+    # Pieces are plain values: no image or other per-instance baggage, so
+    # building boards in bulk stays cheap. Sprites live in chess.renderer.
+    __slots__ = ('color', 'name', 'value', 'has_moved')
+
     def __init__(self,color,name,value):
         self.color=color
         self.name=name
         self.value=value
-        self.image=None
-        self.add_image()
+        self.has_moved=False
         self.adjust_value()
     
     def __repr__(self) -> str:
@@ -22,6 +26,26 @@ class Piece:
             self.value *= -1
 
 
-    def add_image(self):
-        self.full_path ='/home/phantom/coding/python-game/assets/imgs-80px'
-        self.image=image.load(path.join(self.full_path,f'{self.color}_{self.name}.png'))
+    @abstractmethod
+    def attacks(self, board, index):
+        """Bitboard of squares this piece attacks from square `index`."""
+
+    def get_capture_moves(self, board, position):
+        """
+        Only the capture half of get_valid_moves, for search paths (such as
+        quiescence) that ignore quiet moves.
+        Returns: list of (row, col) squares holding opponent pieces
+        """
+        row, col = position
+        enemy = board.occupied ^ board.occupancy[self.color]
+        return to_positions(self.attacks(board, row * 8 + col) & enemy)
+
+    def _split_targets(self, board, targets):
+        """
+        Split a bitboard of target squares into (moves, capture_moves) lists
+        of (row, col) tuples, dropping squares held by our own pieces.
+        """
+        own = board.occupancy[self.color]
+        enemy = board.occupied ^ own
+        return (to_positions(targets & ~board.occupied),
+                to_positions(targets & enemy))
@@ -0,0 +1,109 @@
+# chess/renderer.py
+"""
+Pygame drawing for a Board.
+
+The rules core (Board, Square, pieces) never imports pygame; the GUI draws
+it through this module instead.
+"""
+
+import os.path as path
+import pygame
+from .constant import BOARD_SIZE, SQUARE_SIZE, LIGHT_SQUARE, DARK_SQUARE, HIGHLIGHT_COLORS
+
+IMAGE_DIR = path.join(path.dirname(path.dirname(path.abspath(__file__))), 'assets', 'imgs-80px')
+
+# One Surface per (color, piece name), loaded on first use and shared by
+# every piece and every board in the process.
+_sprite_cache = {}
+
+
+def get_sprite(color, name):
+    key = (color, name)
+    sprite = _sprite_cache.get(key)
+    if sprite is None:
+        sprite = pygame.image.load(path.join(IMAGE_DIR, f'{color}_{name}.png'))
+        _sprite_cache[key] = sprite
+    return sprite
+
+
+class BoardRenderer:
+    """Draws a Board (squares, highlights, pieces and grid) onto a pygame surface."""
+
+    def draw(self, screen, board):
+        screen.fill((50, 50, 50))
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                self.draw_square(screen, board.squares[row][col])
+        self._draw_grid(screen)
+
+    def piece_image(self, piece):
+        return get_sprite(piece.color, piece.name)
+
+    def square_rect(self, square):
+        return pygame.Rect(
+            square.col * SQUARE_SIZE,
+            square.row * SQUARE_SIZE,
+            SQUARE_SIZE,
+            SQUARE_SIZE
+        )
+
+    def draw_square(self, screen, square):
+        rect = self.square_rect(square)
+
+        # Draw square background
+        square_color = LIGHT_SQUARE if square.color == 'light' else DARK_SQUARE
+        pygame.draw.rect(screen, square_color, rect)
+
+        # Draw highlight if exists
+        if square.highlight and square.highlight in HIGHLIGHT_COLORS:
+            highlight_color = HIGHLIGHT_COLORS[square.highlight]
+
+            # Different highlight styles based on type
+            if square.highlight == 'selected':
+                # Thick border for selected piece
+                pygame.draw.rect(screen, highlight_color, rect, 4)
+            elif square.highlight == 'valid_move':
+                # Dot in center for valid moves
+                center = rect.center
+                pygame.draw.circle(screen, highlight_color, center, 8)
+            elif square.highlight == 'capture':
+                # Circle around piece for capture moves
+                pygame.draw.rect(screen, highlight_color, rect, 3)
+            elif square.highlight == 'check':
+                # Red background for king in check
+                pygame.draw.rect(screen, highlight_color, rect)
+                # Redraw piece on top
+                if square.piece:
+                    image = self.piece_image(square.piece)
+                    screen.blit(image, image.get_rect(center=rect.center))
+            elif square.highlight == 'en_passant':
+                # Four corner dots for en passant
+                corners = [
+                    (rect.left + 8, rect.top + 8),      # Top-left
+                    (rect.right - 8, rect.top + 8),     # Top-right
+                    (rect.left + 8, rect.bottom - 8),   # Bottom-left
+                    (rect.right - 8, rect.bottom - 8)   # Bottom-right
+                ]
+                for corner in corners:
+                    pygame.draw.circle(screen, highlight_color, corner, 4)
+            elif square.highlight == 'castling':
+                # Blue border for castling moves
+                pygame.draw.rect(screen, highlight_color, rect, 4)
+                # Add castle icon (simplified)
+                center = rect.center
+                pygame.draw.rect(screen, highlight_color,
+                            (center[0]-8, center[1]-8, 16, 16), 2)
+
+        # Draw piece if exists (unless we're in check highlight)
+        if square.piece and square.highlight != 'check':
+            image = self.piece_image(square.piece)
+            screen.blit(image, image.get_rect(center=rect.center))
+
+    def _draw_grid(self, screen):
+        for i in range(BOARD_SIZE + 1):
+            pygame.draw.line(screen, (0, 0, 0),
+                           (i * SQUARE_SIZE, 0),
+                           (i * SQUARE_SIZE, BOARD_SIZE * SQUARE_SIZE), 2)
+            pygame.draw.line(screen, (0, 0, 0),
+                           (0, i * SQUARE_SIZE),
+                           (BOARD_SIZE * SQUARE_SIZE, i * SQUARE_SIZE), 2)
@@ -0,0 +1,49 @@
+# chess/zobrist.py
+"""
+Zobrist hashing keys.
+
+A position key is the XOR of one random 64-bit number per (color, piece,
+square), one for "black to move", one per castling-rights combination and
+one per en passant file. Board keeps its key up to date incrementally; this
+module also provides a full recompute to check it against.
+"""
+
+import random
+
+from .constant import WHITE, BLACK, PIECE_TYPES, PAWN, BOARD_SIZE
+
+# Fixed seed so keys (and anything cached by key) are stable between runs.
+_rng = random.Random(0x5A0B_71C5)
+
+PIECE_KEYS = {color: {name: [_rng.getrandbits(64) for _ in range(64)] for name in PIECE_TYPES}
+              for color in (WHITE, BLACK)}
+SIDE_KEY = _rng.getrandbits(64)  # XORed in when black is to move
+CASTLING_KEYS = [_rng.getrandbits(64) for _ in range(16)]
+EN_PASSANT_KEYS = [_rng.getrandbits(64) for _ in range(BOARD_SIZE)]
+
+
+def compute_pawn_key(board):
+    """Hash only the pawns (Board.pawn_key, for the pawn structure cache)."""
+    key = 0
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            piece = board.squares[row][col].piece
+            if piece and piece.name == PAWN:
+                key ^= PIECE_KEYS[piece.color][PAWN][row * BOARD_SIZE + col]
+    return key
+
+
+def compute_key(board):
+    """Hash a board from scratch."""
+    key = 0
+    for row in range(BOARD_SIZE):
+        for col in range(BOARD_SIZE):
+            piece = board.squares[row][col].piece
+            if piece:
+                key ^= PIECE_KEYS[piece.color][piece.name][row * BOARD_SIZE + col]
+    if board.current_player == BLACK:
+        key ^= SIDE_KEY
+    key ^= CASTLING_KEYS[board.castling_rights]
+    if board.en_passant_square:
+        key ^= EN_PASSANT_KEYS[board.en_passant_square[1]]
+    return key
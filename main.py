@@ -43,7 +43,8 @@ def main():
     game = ChessGameManager(
         game_mode='human_vs_ai',  # Change this to test different modes
         ai_color='black',         # AI plays black
-        ai_depth=3                # AI thinking depth
+        ai_depth=3,               # AI thinking depth
+        ponder=True               # AI thinks on your time too
     )
     
     game.run()